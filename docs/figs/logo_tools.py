@@ -1,12 +1,59 @@
 """Tools to create the pkgcreator logo."""
 
 from pathlib import Path
+from string import Template
+
+# Indentation used in the svg file (directly emitted, no later replacement needed)
+INDENT = "   "
+
+
+def _indented(text: str) -> str:
+    """Replace tabs by the indentation used in the svg file."""
+    return text.replace("\t", INDENT)
+
+
+# Templates of the logo elements, parsed once and filled for every variant
+BACKGROUND_TEMPLATE = Template(
+    _indented(
+        '<rect\n\tid="background"\n\twidth="$width%"\n\theight="$height%"'
+        '\n\tfill="$fill"\n\tstroke="$stroke"\n\tstroke-width="$stroke_width" />'
+    )
+)
+BOX_TEMPLATE = Template(
+    _indented(
+        '<rect\n\tid="package box front"\n\twidth="$width"\n\theight="$height"'
+        '\n\tx="$x"\n\ty="$y"\n\tfill="$front_color" />'
+        "\n\n"
+        '<polygon\n\tid="package box top"'
+        '\n\tpoints="$front_top_left $front_top_right $top_top_right $top_top_left"'
+        '\n\tfill="$top_color" />'
+        "\n\n"
+        '<polygon\n\tid="package box side"'
+        '\n\tpoints="$front_top_left $top_top_left '
+        '$side_bottom_left $front_bottom_left"'
+        '\n\tfill="$side_color" />'
+        "\n\n"
+        '<path\n\tid="package box outline"'
+        '\n\td="M $top_top_left V $y_side L $front_bottom_left H $x_right V $y '
+        'L $top_top_right Z"'
+        '\n\tfill="none"\n\tstroke="$stroke_color"\n\tstroke-width="$stroke_width" />'
+    )
+)
+TEXT_TEMPLATE = Template(
+    _indented(
+        '<text id="text-$text" x="$x" y="$y" font-family="$font" '
+        'font-size="$size" font-weight="$weight" fill="$color" '
+        'stroke="$stroke_color" stroke-width="$stroke_width">'
+        "\n\t$text\n</text>"
+    )
+)
 
 
 def dict_to_xml_object(name, config: dict) -> str:
     """Convert a dictionary to an xml object."""
-    result = "\n\t".join(f'{key}="{value}"' for key, value in config.items())
-    return f"<{name}\n\t{result} />"
+    separator = f"\n{INDENT}"
+    result = separator.join(f'{key}="{value}"' for key, value in config.items())
+    return f"<{name}{separator}{result} />"
 
 
 def make_background_box(
@@ -17,16 +64,12 @@ def make_background_box(
     height: float = 100,
 ):
     """Make a colored box (e.g. as a background), widht/height are percent."""
-    return dict_to_xml_object(
-        "rect",
-        {
-            "id": "background",
-            "width": f"{width}%",
-            "height": f"{height}%",
-            "fill": color,
-            "stroke": stroke_color,
-            "stroke-width": stroke_width,
-        },
+    return BACKGROUND_TEMPLATE.substitute(
+        width=width,
+        height=height,
+        fill=color,
+        stroke=stroke_color,
+        stroke_width=stroke_width,
     )
 
 
@@ -44,74 +87,31 @@ def make_3d_box(
     stroke_width: int = 2,
 ):
     """Make a 3D box."""
-    front = dict_to_xml_object(
-        "rect",
-        {
-            "id": "package box front",
-            "width": width,
-            "height": height,
-            "x": x,
-            "y": y,
-            "fill": front_color,
-            # "stroke": stroke_color,
-            # "stroke-width": stroke_width,
-        },
-    )
-
     x_right = x + width
     x_left = x - delta_width
     y_up = y - delta_height
     y_down = y + height
-    front_top_left = f"{x},{y}"
-    front_top_right = f"{x_right},{y}"
-    front_bottom_left = f"{x},{y_down}"
-    top_top_left = f"{x_left},{y_up}"
-    top_top_right = f"{x_right - delta_width},{y_up}"
-    side_bottom_left = f"{x_left},{y_down - delta_height}"
-
-    top = dict_to_xml_object(
-        "polygon",
-        {
-            "id": "package box top",
-            "points": (
-                f"{front_top_left} {front_top_right} {top_top_right} " f"{top_top_left}"
-            ),
-            "fill": top_color,
-            # "stroke": stroke_color,
-            # "stroke-width": stroke_width,
-        },
-    )
-
-    side = dict_to_xml_object(
-        "polygon",
-        {
-            "id": "package box side",
-            "points": (
-                f"{front_top_left} {top_top_left} {side_bottom_left} "
-                f"{front_bottom_left}"
-            ),
-            "fill": side_color,
-            # "stroke": stroke_color,
-            # "stroke-width": stroke_width,
-        },
-    )
 
-    outline = dict_to_xml_object(
-        "path",
-        {
-            "id": "package box outline",
-            "d": (
-                f"M {top_top_left} V {y_down - delta_height} L {front_bottom_left} "
-                f"H {x_right} V {y} L {top_top_right} Z"
-            ),
-            "fill": "none",
-            "stroke": stroke_color,
-            "stroke-width": stroke_width,
-        },
+    return BOX_TEMPLATE.substitute(
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        x_right=x_right,
+        y_side=y_down - delta_height,
+        front_top_left=f"{x},{y}",
+        front_top_right=f"{x_right},{y}",
+        front_bottom_left=f"{x},{y_down}",
+        top_top_left=f"{x_left},{y_up}",
+        top_top_right=f"{x_right - delta_width},{y_up}",
+        side_bottom_left=f"{x_left},{y_down - delta_height}",
+        front_color=front_color,
+        side_color=side_color,
+        top_color=top_color,
+        stroke_color=stroke_color,
+        stroke_width=stroke_width,
     )
 
-    return "\n\n".join([front, top, side, outline])
-
 
 def make_text(
     text: str,
@@ -125,11 +125,16 @@ def make_text(
     stroke_width: float = 2,
 ):
     """Make a text element."""
-    return (
-        f'<text id="text-{text}" x="{x}" y="{y}" font-family="{font}" '
-        f'font-size="{size}" font-weight="{weight}" fill="{color}" '
-        f'stroke="{stroke_color}" stroke-width="{stroke_width}">'
-        f"\n\t{text}\n</text>"
+    return TEXT_TEMPLATE.substitute(
+        text=text,
+        x=x,
+        y=y,
+        color=color,
+        font=font,
+        size=size,
+        weight=weight,
+        stroke_color=stroke_color,
+        stroke_width=stroke_width,
     )
 
 
@@ -139,28 +144,37 @@ def save_svg(
     overwrite: bool = False,
     width: int = 200,
     height: int = 200,
-    replace_tab: str = "   ",
+    replace_tab: str = INDENT,
     background_color: str = "",
 ):
-    """Save a svg content string to an svg document (header is created)."""
+    """
+    Save a svg content string to an svg document (header is created).
+
+    Every tab is replaced by 'replace_tab' (tabs are kept if it is empty). The content
+    created by the functions of this module is indented with `INDENT` instead of tabs,
+    this indentation is replaced the same way.
+    """
     filepath = Path(filename)
     if filepath.exists() and not overwrite:
         raise FileExistsError(f"{filepath} exists!")
+    tab = replace_tab or "\t"
     header = "\n".join(
         [
             '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
             '<svg xmlns="http://www.w3.org/2000/svg"',
-            f'\twidth="{width}" height="{height}"',
-            f'\tviewBox="0 0 {width} {height}"',
-            f'\tstyle="background-color:{background_color}"',
-            '\tversion="1.1">',
+            f'{tab}width="{width}" height="{height}"',
+            f'{tab}viewBox="0 0 {width} {height}"',
+            f'{tab}style="background-color:{background_color}"',
+            f'{tab}version="1.1">',
         ]
     )
+    if tab != INDENT:
+        content = content.replace(f"\n{INDENT}", f"\n{tab}")
+    if replace_tab and "\t" in content:
+        content = content.replace("\t", replace_tab)
     file_content = f"{header}\n{content}\n</svg>"
-    if replace_tab:
-        file_content = file_content.replace("\t", replace_tab)
 
-    with open(filename, "w") as file:
+    with open(filename, "w", encoding="utf-8") as file:
         file.write(file_content)
 
 
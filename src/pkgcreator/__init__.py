@@ -8,7 +8,8 @@ Available components include:
 - Git repository management (`GitRepository`, `GithubRepository`)
 - Virtual environment handling (`VirtualEnvironment`)
 - Python package building (`PythonPackage`, `ProjectSettings`)
-- License management (`get_available_licenses`, `get_license`)
+- License management (`get_available_licenses`, `get_license`,
+  `get_all_licenses_bulk`)
 - Git utilities and exceptions
 
 Importing from `pkgcreator` gives access to the core functionality for
@@ -19,7 +20,13 @@ from importlib.metadata import version, PackageNotFoundError
 
 from pkgcreator.ghutils import GithubRepository
 from pkgcreator.builder import PackageExistsError, ProjectSettings, PythonPackage
-from pkgcreator.file_contents import FileContent, get_available_licenses, get_license
+from pkgcreator.file_contents import (
+    FileContent,
+    get_all_licenses_bulk,
+    get_available_licenses,
+    get_license,
+    prefetch_licenses,
+)
 from pkgcreator.gitrepo import (
     GIT_AVAILABLE,
     GitNotAvailableError,
@@ -27,6 +34,7 @@ from pkgcreator.gitrepo import (
     GitRepositoryExistsError,
     GitRepositoryNotFoundError,
     get_git_config_value,
+    get_git_user_config,
     run_git_command,
 )
 from pkgcreator.venv_manager import VirtualEnvironment
@@ -48,8 +56,11 @@ __all__ = [
     "PythonPackage",
     "VirtualEnvironment",
     "GIT_AVAILABLE",
+    "get_all_licenses_bulk",
     "get_available_licenses",
     "get_license",
+    "prefetch_licenses",
     "get_git_config_value",
+    "get_git_user_config",
     "run_git_command",
 ]
@@ -8,11 +8,39 @@ Includes tools to:
 """
 
 import argparse
-from dataclasses import MISSING, dataclass, field, fields
+import os
+from collections.abc import Iterator
+from dataclasses import MISSING, Field, dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar
 
 from pkgcreator import GithubRepository
 
+# Number of files above which they are written in parallel
+PARALLEL_WRITE_THRESHOLD = 8
+# Flags to create a new file exclusively (binary mode is only relevant on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Fields of ProjectSettings that represent URLs or advanced settings (ordered)
+URL_FIELDS = (
+    "changelog",
+    "documentation",
+    "download",
+    "funding",
+    "homepage",
+    "issues",
+    "releasenotes",
+    "source",
+)
+ADVANCED_FIELDS = ("classifiers", "dependencies", "optional_dependencies")
+
+DEFAULT_CLASSIFIERS = (
+    "Programming Language :: Python :: 3",
+    "Operating System :: OS Independent",
+)
+
 
 class PackageExistsError(FileExistsError):
     """Raised when the package directory already exists and creation is attempted."""
@@ -25,16 +53,68 @@ def default_classifiers() -> list[str]:
     Returns
     -------
     list of str
-        Default classifiers used in the package metadata.
+        Default classifiers used in the package metadata (a new list on each call).
     """
-    return [
-        "Programming Language :: Python :: 3",
-        "Operating System :: OS Independent",
-    ]
+    return list(DEFAULT_CLASSIFIERS)
+
+
+def str_to_bool(value: str) -> bool:
+    """
+    Convert a command line value to bool.
+
+    Parameters
+    ----------
+    value : str
+        Value like 'yes'/'no', 'true'/'false', 'on'/'off', or '1'/'0'.
 
+    Returns
+    -------
+    bool
+        Converted value.
 
-@dataclass(kw_only=True)
-class ProjectSettings:
+    Raises
+    ------
+    ValueError
+        If the value is not a valid boolean.
+    """
+    match value.lower():
+        case "yes" | "y" | "true" | "on" | "1":
+            return True
+        case "no" | "n" | "false" | "off" | "0":
+            return False
+        case _:
+            raise ValueError(f"Invalid boolean value '{value}'!")
+
+
+# Converters used by argparse for the field types (annotations or their names)
+ARGPARSE_TYPES = MappingProxyType(
+    {
+        str: str,
+        "str": str,
+        int: int,
+        "int": int,
+        float: float,
+        "float": float,
+        bool: str_to_bool,
+        "bool": str_to_bool,
+    }
+)
+
+
+class _ProjectSettingsState:
+    """Attributes of `ProjectSettings` that are not dataclass fields (slots only)."""
+
+    __slots__ = ("github_repository", "_auto_urls", "_cached")
+
+    def __new__(cls, *args, **kwargs) -> "_ProjectSettingsState":
+        """Create the object with '_auto_urls' unset (None) until it is initialised."""
+        self = super().__new__(cls)
+        object.__setattr__(self, "_auto_urls", None)
+        return self
+
+
+@dataclass(kw_only=True, slots=True)
+class ProjectSettings(_ProjectSettingsState):
     """
     Container for project metadata and configuration used to create a Python package.
 
@@ -91,36 +171,61 @@ class ProjectSettings:
     releasenotes: str = None
     source: str = None
 
+    # Dataclass fields, set once after the class creation (see below)
+    _FIELDS: ClassVar[tuple[Field, ...]]
+    _FIELD_NAMES: ClassVar[frozenset[str]]
+    _FIELD_GETTER: ClassVar[attrgetter]
+    _DEFAULTS: ClassVar[MappingProxyType]
+    _CLI_META: ClassVar[MappingProxyType]
+    _URL_FIELDS: ClassVar[frozenset[str]] = frozenset(URL_FIELDS)
+    _ADVANCED_FIELDS: ClassVar[frozenset[str]] = frozenset(ADVANCED_FIELDS)
+
     def __post_init__(self) -> None:
-        """Create the GithubRepository object from the parameters."""
+        """Create the GithubRepository object and fill the unset URLs from it."""
+        # Values derived from immutable fields, e.g. 'urls' (reset when a field is set)
+        self._cached = {}
+        # Names of the URL fields that were filled automatically
+        self._auto_urls = set()
+        self._set_github_repository()
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set attribute value and keep the URLs created from GitHub up to date."""
+        # Note: 'super()' without arguments does not work for dataclasses with slots
+        if (auto_urls := self._auto_urls) is None:
+            # Still initialising, the URLs are filled in '__post_init__'
+            object.__setattr__(self, name, value)
+            return
+        if name in self._URL_FIELDS:
+            if value is None:
+                value = self.github_repository.get_url(name, branch=False)
+                auto_urls.add(name)
+            else:
+                auto_urls.discard(name)
+        object.__setattr__(self, name, value)
+        if name in ("github_username", "github_repositoryname"):
+            self._set_github_repository()
+        if name in self._FIELD_NAMES:
+            self._cached.clear()
+
+    def _set_github_repository(self) -> None:
+        """Create the GithubRepository object and (re-)fill the automatic URLs."""
         self.github_repository = GithubRepository(
             self.github_username, self.github_repositoryname
         )
-
-    def __getattribute__(self, name: str):
-        """
-        Get attribute value and automatically generate URL if unset.
-
-        Parameters
-        ----------
-        name : str
-            Attribute name.
-
-        Returns
-        -------
-        any
-            Attribute value or auto-generated URL.
-        """
-        value = super().__getattribute__(name)
-        if value is None and name in self.get_url_fields():
-            return self.github_repository.get_url(name, branch=False)
-        else:
-            return value
+        for name in URL_FIELDS:
+            if name in self._auto_urls or getattr(self, name) is None:
+                url = self.github_repository.get_url(name, branch=False)
+                object.__setattr__(self, name, url)
+                self._auto_urls.add(name)
 
     def is_default(self, name: str) -> bool:
         """
         Check whether a field is set to its default value.
 
+        Fields with a default factory (e.g. 'classifiers') are compared to a new
+        default value, and URLs filled automatically from the GitHub settings count as
+        default as long as they are not set explicitly.
+
         Parameters
         ----------
         name : str
@@ -136,13 +241,30 @@ class ProjectSettings:
         AttributeError
             If the field name is invalid.
         """
-        for _field in fields(self):
-            if _field.name != name:
-                continue
-            return getattr(self, name) == _field.default
-        else:
+        try:
+            default = self._DEFAULTS[name]
+        except KeyError:
             msg = f"Field '{name}' unkown!"
-            raise AttributeError(msg)
+            raise AttributeError(msg) from None
+        if name in self._auto_urls:
+            # Filled from the GitHub settings, but not set explicitly
+            return True
+        return getattr(self, name) == default
+
+    @property
+    def cache_key(self) -> tuple:
+        """
+        Get a hashable snapshot of all field values (e.g. to use as a cache key).
+
+        Returns
+        -------
+        tuple
+            Values of all fields (lists are converted to tuples).
+        """
+        values = (getattr(self, _field.name) for _field in self._FIELDS)
+        return tuple(
+            tuple(value) if isinstance(value, list) else value for value in values
+        )
 
     @property
     def github(self) -> str:
@@ -154,7 +276,7 @@ class ProjectSettings:
         str
             GitHub repository URL.
         """
-        return self.github_repository.get_url(branch=False)
+        return self.github_repository.url
 
     @property
     def github_owner(self) -> str:
@@ -166,7 +288,10 @@ class ProjectSettings:
         str
             GitHub owner URL.
         """
-        return self.github_repository.get_url("owner", branch=False)
+        if (url := self._cached.get("github_owner")) is None:
+            url = self.github_repository.get_url("owner", branch=False)
+            self._cached["github_owner"] = url
+        return url
 
     @staticmethod
     def get_url_fields() -> tuple[str]:
@@ -178,16 +303,7 @@ class ProjectSettings:
         tuple of str
             Field names for URL fields.
         """
-        return (
-            "changelog",
-            "documentation",
-            "download",
-            "funding",
-            "homepage",
-            "issues",
-            "releasenotes",
-            "source",
-        )
+        return URL_FIELDS
 
     @staticmethod
     def get_advanced_fields() -> tuple[str]:
@@ -199,28 +315,33 @@ class ProjectSettings:
         tuple of str
             Field names for advanced settings.
         """
-        return (
-            "classifiers",
-            "dependencies",
-            "optional_dependencies",
-        )
+        return ADVANCED_FIELDS
 
     @property
-    def urls(self) -> dict[str]:
+    def urls(self) -> dict[str, str]:
         """
         Get dictionary of URL-related fields and their values.
 
+        The result is cached until one of the fields is set again.
+
         Returns
         -------
         dict of str
             Mapping of field names to URL values.
         """
-        names = self.get_url_fields()
-        return {
-            name.capitalize(): _url
-            for name in names
-            if (_url := getattr(self, name)) is not None
-        }
+        if (urls := self._cached.get("urls")) is None:
+            values = self._snapshot()
+            urls = self._cached["urls"] = {
+                name.capitalize(): _url
+                for name in URL_FIELDS
+                if (_url := values[name]) is not None
+            }
+        return urls
+
+    def _snapshot(self) -> dict:
+        """Return the values of all fields (read at once and in the field order)."""
+        names = (_field.name for _field in self._FIELDS)
+        return dict(zip(names, self._FIELD_GETTER(self), strict=True))
 
     @property
     def nice_str(self) -> str:
@@ -232,14 +353,12 @@ class ProjectSettings:
         str
             Multiline string displaying all non-empty fields.
         """
-        values = {
-            _field.name: value
-            for _field in fields(self)
-            if (value := getattr(self, _field.name))
-        }
-        n_max = max(map(len, values.keys()))
-
-        return "\n".join([f"{name:<{n_max}} {value}" for name, value in values.items()])
+        # Not cached, since list fields (e.g. 'classifiers') may be changed in place
+        values = {name: value for name, value in self._snapshot().items() if value}
+        n_max = max((len(name) for name in values), default=0)
+        return "\n".join(
+            f"{name.ljust(n_max)} {value}" for name, value in values.items()
+        )
 
     @classmethod
     def add_to_argparser(
@@ -271,7 +390,6 @@ class ProjectSettings:
                 "(default: create from github settings)"
             ),
         )
-        url_fields = cls.get_url_fields()
         advanced = parser.add_argument_group(
             title="advanced project settings",
             description=(
@@ -279,10 +397,9 @@ class ProjectSettings:
                 "(probably evolve during package development)"
             ),
         )
-        advanced_fields = cls.get_advanced_fields()
 
         # Add arguments to the correct sections
-        for _field in fields(cls):
+        for _field in cls._FIELDS:
             # Ignoring or special treatment
             if _field.name in ignore:
                 continue
@@ -297,14 +414,16 @@ class ProjectSettings:
                 )
                 continue
             # Default treatment according to settings above
-            argument = f'--{_field.name.replace("_", "-")}'
-            help_str = f'{_field.name.replace("_", " ")}'
-            options = {"type": _field.type, "default": cls.get_field_default(_field)}
-            if _field.name in url_fields:
+            argument, help_str = cls._CLI_META[_field.name]
+            options = {
+                "type": ARGPARSE_TYPES.get(_field.type, str),
+                "default": cls.get_field_default(_field),
+            }
+            if _field.name in cls._URL_FIELDS:
                 options["help"] = f"url to {help_str}"
                 options["metavar"] = "URL"
                 _parser = urls
-            elif _field.name in advanced_fields:
+            elif _field.name in cls._ADVANCED_FIELDS:
                 options["metavar"] = "STR"
                 options["nargs"] = "+"
                 options["type"] = str  # argparse needs the type of the list content!
@@ -330,9 +449,11 @@ class ProjectSettings:
         ProjectSettings
             Initialized project settings object.
         """
-        args_dict = vars(args)
-        names = [_field.name for _field in fields(cls)]
-        options = {name: value for name, value in args_dict.items() if name in names}
+        options = {
+            name: value
+            for name, value in vars(args).items()
+            if name in cls._FIELD_NAMES
+        }
 
         return cls(**options)
 
@@ -368,6 +489,24 @@ class ProjectSettings:
             return None
 
 
+ProjectSettings._FIELDS = fields(ProjectSettings)
+ProjectSettings._FIELD_NAMES = frozenset(_f.name for _f in ProjectSettings._FIELDS)
+ProjectSettings._FIELD_GETTER = attrgetter(*(_f.name for _f in ProjectSettings._FIELDS))
+ProjectSettings._DEFAULTS = MappingProxyType(
+    {
+        _f.name: ProjectSettings.get_field_default(_f, raise_err=False)
+        for _f in ProjectSettings._FIELDS
+    }
+)
+# Command line argument and help label of each field
+ProjectSettings._CLI_META = MappingProxyType(
+    {
+        _f.name: (f"--{_f.name.replace('_', '-')}", _f.name.replace("_", " "))
+        for _f in ProjectSettings._FIELDS
+    }
+)
+
+
 class PythonPackage:
     """
     Tool to create a Python package directory structure.
@@ -405,7 +544,8 @@ class PythonPackage:
         self._parent_dir = Path(destination)
         self._dir_name = dir_name or name
         self._name = name
-        self.add_main = add_main
+        self._add_main = add_main
+        self._structure = None
         self._set_project_path()
 
     @property
@@ -416,6 +556,7 @@ class PythonPackage:
     @parent_dir.setter
     def parent_dir(self, new_value: str | Path) -> None:
         self._parent_dir = Path(new_value)
+        self._set_project_path()
 
     @property
     def dir_name(self) -> str:
@@ -425,6 +566,8 @@ class PythonPackage:
     @dir_name.setter
     def dir_name(self, new_value: str) -> None:
         self._dir_name = new_value
+        self._structure = None
+        self._set_project_path()
 
     @property
     def name(self) -> str:
@@ -434,6 +577,17 @@ class PythonPackage:
     @name.setter
     def name(self, new_value: str) -> None:
         self._name = new_value
+        self._structure = None
+
+    @property
+    def add_main(self) -> bool:
+        """Get whether a `__main__.py` file is included."""
+        return self._add_main
+
+    @add_main.setter
+    def add_main(self, new_value: bool) -> None:
+        self._add_main = new_value
+        self._structure = None
 
     @property
     def project_path(self) -> Path:
@@ -442,16 +596,18 @@ class PythonPackage:
 
     @property
     def structure(self) -> dict:
-        """Get the structure definition for the package."""
-        module_files = ["__init__.py"]
-        if self.add_main:
-            module_files.append("__main__.py")
-        return {
-            self.dir_name: {
-                "src": {self.name: {"FILES": module_files}},
-                "FILES": ["LICENSE", "README.md", "pyproject.toml", ".gitignore"],
+        """Get the structure definition for the package (created only once)."""
+        if self._structure is None:
+            module_files = ["__init__.py"]
+            if self.add_main:
+                module_files.append("__main__.py")
+            self._structure = {
+                self.dir_name: {
+                    "src": {self.name: {"FILES": module_files}},
+                    "FILES": ["LICENSE", "README.md", "pyproject.toml", ".gitignore"],
+                }
             }
-        }
+        return self._structure
 
     def create(self, file_content: dict | None = None) -> None:
         """
@@ -467,10 +623,17 @@ class PythonPackage:
         PackageExistsError
             If the target project directory already exists.
         """
-        if self.project_path.exists():
+        # The project directory is created first (exclusively), so nothing is created
+        # if it already exists and no separate check is needed
+        try:
+            create_dir_structure(
+                self.parent_dir, self.structure, file_content=file_content
+            )
+        except FileExistsError as err:
+            if Path(err.filename) != self.project_path:
+                raise
             msg = f"The project path '{self.project_path}' already exists!"
-            raise PackageExistsError(msg)
-        create_dir_structure(self.parent_dir, self.structure, file_content=file_content)
+            raise PackageExistsError(msg) from None
 
     def get_all_filenames(self) -> list[str]:
         """
@@ -484,47 +647,118 @@ class PythonPackage:
         return get_all_filenames_from_structure(self.structure)
 
     def _set_project_path(self) -> None:
-        """Determine and set the full project path based on the directory structure."""
-        if len(keys := list(self.structure.keys())) == 1:
-            self._project_path = self.parent_dir.joinpath(keys[0])
-        else:
-            self._project_path = self.parent_dir
+        """Determine and set the full project path (the structure's only top dir)."""
+        self._project_path = self._parent_dir / self._dir_name
 
 
 def create_dir_structure(
-    path: Path, structure: dict, file_content: dict | None = None
+    path: str | Path, structure: dict, file_content: dict | None = None
 ) -> None:
     """
-    Recursively create directory and file structure.
+    Create directory and file structure.
+
+    The structure is walked once (see `walk_structure()`), every directory is created
+    with a single `mkdir` and every file is opened exactly once (in exclusive creation
+    mode). More than `PARALLEL_WRITE_THRESHOLD` files are written in parallel.
 
     Parameters
     ----------
-    path : Path
+    path : str or Path
         Root path where the structure should be created.
     structure : dict
         Nested dictionary describing folders and files.
     file_content : dict, optional
-        Optional mapping of filenames to file content.
+        Optional mapping of filenames to file content (str or encoded bytes).
+
+    Raises
+    ------
+    FileExistsError
+        If one of the directories or files already exists.
     """
-    for key, substructure in structure.items():
-        if key == "FILES":
-            # Create files and, if available, set the content
-            for filename in substructure:
-                file = path.joinpath(filename)
-                file.touch(exist_ok=False)
-                if file_content and filename in file_content:
-                    with open(file, "w") as file_obj:
-                        file_obj.write(file_content[filename])
+    file_content = file_content or {}
+    # Directories are yielded before their files, i.e. they exist when writing
+    files = []
+    for kind, item_path, name in walk_structure(structure, path):
+        if kind == "dir":
+            os.mkdir(item_path)
         else:
-            # Create subdirectory
-            dir_path = path.joinpath(key)
-            dir_path.mkdir()
-            create_dir_structure(dir_path, substructure, file_content=file_content)
+            files.append((item_path, file_content.get(name)))
+
+    if len(files) <= PARALLEL_WRITE_THRESHOLD:
+        for file_path, content in files:
+            _write_file(file_path, content)
+        return
+
+    # Overlap the latency of many files (e.g. on network file systems)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Consume the results to raise possible errors
+        list(executor.map(lambda args: _write_file(*args), files))
+
+
+def _write_file(file_path: str, content: str | bytes | None) -> None:
+    """
+    Create a file (exclusively) and, if available, set its content.
+
+    The content is always written as bytes directly to the file descriptor, so the
+    newlines are kept as they are and no (text or buffer) layer is involved.
+    """
+    if not content:
+        content = b""
+    elif isinstance(content, str):
+        content = content.encode("utf-8")
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        data = memoryview(content)
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def walk_structure(
+    structure: dict, path: str | Path = ""
+) -> Iterator[tuple[str, str, str]]:
+    """
+    Walk through a folder structure definition (iteratively with a stack).
+
+    Plain strings are used for the paths since this avoids creating `Path` objects.
+
+    Parameters
+    ----------
+    structure : dict
+        Nested dictionary describing folders and files.
+    path : str or Path, optional
+        Root path of the structure (default: paths relative to the structure).
+
+    Yields
+    ------
+    tuple of (str, str, str)
+        Kind ('dir' or 'file'), path, and name of each item. A directory is always
+        yielded before its content.
+    """
+    # The stack holds the remaining items of each open folder, so that the order is
+    # the same as for a recursive walk (depth-first, in order of definition)
+    stack = [(os.fspath(path), iter(structure.items()))]
+    while stack:
+        parent, items = stack[-1]
+        for key, value in items:
+            if key == "FILES":
+                for filename in value:
+                    yield "file", os.path.join(parent, filename), filename
+            else:
+                dir_path = os.path.join(parent, key)
+                yield "dir", dir_path, key
+                stack.append((dir_path, iter(value.items())))
+                break
+        else:
+            stack.pop()
 
 
 def get_all_filenames_from_structure(structure: dict) -> list[str]:
     """
-    Recursively extract all filenames from a folder structure definition.
+    Extract all filenames from a folder structure definition.
 
     Parameters
     ----------
@@ -536,11 +770,4 @@ def get_all_filenames_from_structure(structure: dict) -> list[str]:
     list of str
         All file names in the structure.
     """
-    files = []
-    for key, substructure in structure.items():
-        if key == "FILES":
-            files += substructure
-        else:
-            files += get_all_filenames_from_structure(substructure)
-
-    return files
+    return [name for kind, _, name in walk_structure(structure) if kind == "file"]
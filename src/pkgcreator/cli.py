@@ -5,7 +5,6 @@ Includes all parsers and the logic for the CLI.
 """
 
 import argparse
-from pathlib import Path
 from subprocess import CalledProcessError
 
 from pkgcreator import (
@@ -21,9 +20,16 @@ from pkgcreator import (
     PythonPackage,
     VirtualEnvironment,
     get_available_licenses,
-    get_git_config_value,
+    get_git_user_config,
+    prefetch_licenses,
 )
-from pkgcreator.cli_tools import ConsistentFormatter, get_prompt_bool
+from pkgcreator.cli_tools import (
+    ConsistentFormatter,
+    LazySubParsersAction,
+    get_prompt_bool,
+    get_prompt_bools,
+)
+from pkgcreator.file_contents import start_license_download
 from pkgcreator.logging_tools import logger
 
 
@@ -127,6 +133,14 @@ def get_creator_parser(
         action="store_true",
         help="list all available licenses and exit",
     )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help=(
+            "together with '--list-licenses': download all license texts in parallel "
+            "and show their full names"
+        ),
+    )
     ProjectSettings.add_to_argparser(parser, ignore=("name", "make_script"))
 
     return parser
@@ -365,34 +379,30 @@ def patch_creator_default_settings(
     project_settings: ProjectSettings, args: argparse.Namespace
 ) -> None:
     """Ask or decide how a few settings should behave when not set explicitly."""
-    if project_settings.is_default("github_repositoryname"):
-        if get_prompt_bool(
-            f"'--github-repositoryname' was not set. Set to {args.name}?",
-            args.prompt_mode,
-            auto_decision=True,
-        ):
-            project_settings.github_repositoryname = args.name
-            logger.info(f"Set '--github-repositoryname' to {args.name}")
-
-    if GIT_AVAILABLE and project_settings.is_default("author_name"):
-        if git_user := get_git_config_value("user.name"):
-            if get_prompt_bool(
-                f"'--author-name' was not set. Set to {git_user} (from 'git config')?",
-                args.prompt_mode,
-                auto_decision=True,
-            ):
-                project_settings.author_name = git_user
-                logger.info(f"Set '--author-name' to {git_user}")
-
-    if GIT_AVAILABLE and project_settings.is_default("author_mail"):
-        if git_mail := get_git_config_value("user.email"):
-            if get_prompt_bool(
-                f"'--author-mail' was not set. Set to {git_mail} (from 'git config')?",
-                args.prompt_mode,
-                auto_decision=True,
-            ):
-                project_settings.author_mail = git_mail
-                logger.info(f"Set '--author-mail' to {git_mail}")
+    # Collect all pending decisions first, so that they can be asked at once
+    suggestions = {"github_repositoryname": (args.name, "")}
+    if GIT_AVAILABLE:
+        git_config = get_git_user_config()
+        for name, key in (("author_name", "user.name"), ("author_mail", "user.email")):
+            if value := git_config.get(key):
+                suggestions[name] = (value, " (from 'git config')")
+
+    pending = []
+    for name, (value, source) in suggestions.items():
+        if project_settings.is_default(name):
+            option = f"--{name.replace('_', '-')}"
+            message = f"'{option}' was not set. Set to {value}{source}?"
+            pending.append((option, name, value, message))
+
+    decisions = get_prompt_bools(
+        [message for *_, message in pending],
+        args.prompt_mode,
+        auto_decisions=[True] * len(pending),
+    )
+    for (option, name, value, _), decision in zip(pending, decisions, strict=True):
+        if decision:
+            setattr(project_settings, name, value)
+            logger.info(f"Set '{option}' to {value}")
 
 
 def creation_mode(args: argparse.Namespace) -> None:
@@ -400,20 +410,26 @@ def creation_mode(args: argparse.Namespace) -> None:
     # Setup the project settings
     project_settings = ProjectSettings.from_argparser(args)
     project_settings.make_script = args.make_script
-    destination_path = Path(args.destination)
 
-    builder = PythonPackage(destination_path, args.name, add_main=args.make_script)
-    if builder.project_path.exists():
-        msg = f"The project path '{builder.project_path}' already exists!"
+    builder = PythonPackage(args.destination, args.name, add_main=args.make_script)
+    project_path = builder.project_path
+    if project_path.exists():
+        msg = f"The project path '{project_path}' already exists!"
         raise PackageExistsError(msg)
 
+    # Download the license while the user is asked for the settings
+    license_download = None
+    if project_settings.license_id is not None:
+        license_download = start_license_download(project_settings.license_id)
+
     # Ask for some settings if not specified
     patch_creator_default_settings(project_settings, args)
 
     # Check and return if creation is aborted, but ignore the "no" mode this time!
+    resolved_project_path = project_path.resolve()
     msg = (
         f"Settings:\n{project_settings.nice_str}\n"
-        f"Create package '{builder.name}' at '{builder.project_path.resolve()}'?"
+        f"Create package '{builder.name}' at '{resolved_project_path}'?"
     )
     if (
         not get_prompt_bool(msg, args.prompt_mode, auto_decision=True)
@@ -423,9 +439,11 @@ def creation_mode(args: argparse.Namespace) -> None:
         return
 
     # Create the package structure with file content
+    if license_download is not None:
+        license_download.join()
     file_content = FileContent(project_settings)
-    builder.create(file_content=file_content)
-    logger.info(f"Created project '{builder.name}' at '{builder.project_path}'")
+    builder.create(file_content=file_content.encoded())
+    logger.info(f"Created project '{builder.name}' at '{project_path}'")
 
     # Create git repository if wanted
     if GIT_AVAILABLE:
@@ -433,7 +451,7 @@ def creation_mode(args: argparse.Namespace) -> None:
         if args.init_git or get_prompt_bool(
             git_msg, args.prompt_mode, auto_decision=False
         ):
-            git_repository = GitRepository(builder.project_path, logger=logger)
+            git_repository = GitRepository(project_path, logger=logger)
             git_repository.init()
             try:
                 git_repository.add()
@@ -444,17 +462,23 @@ def creation_mode(args: argparse.Namespace) -> None:
     # Create ven and install package in editable mode if wanted
     msg = "Initalise venv and install package in editable mode?"
     if args.init_venv or get_prompt_bool(msg, args.prompt_mode, auto_decision=False):
-        virtual_env = VirtualEnvironment(builder.project_path)
+        virtual_env = VirtualEnvironment(project_path)
         virtual_env.create()
-        virtual_env.install_packages(
-            editable_packages=[str(builder.project_path.resolve())]
-        )
+        virtual_env.install_packages(editable_packages=[str(resolved_project_path)])
 
 
-def list_licenses_mode() -> None:
-    """Show available licenses."""
+def list_licenses_mode(prefetch: bool = False) -> None:
+    """Show available licenses (with their full names if 'prefetch')."""
     available_licenses = get_available_licenses()
-    licenses_str = ", ".join(available_licenses.keys())
+    if prefetch:
+        texts = prefetch_licenses(available_licenses.keys(), available_licenses)
+        lines = []
+        for name, text in texts.items():
+            full_name, _, _ = text.partition("\n")
+            lines.append(f"{name}: {full_name}")
+        licenses_str = "\n".join(lines)
+    else:
+        licenses_str = ", ".join(available_licenses.keys())
     logger.info(f"Available licenses are:\n{licenses_str}")
 
 
@@ -563,23 +587,26 @@ def main() -> None:
         ),
         formatter_class=formatter_class,
     )
-    subparsers = parser.add_subparsers(dest="feature")
-
-    feature_parsers = (
-        get_creator_parser,
-        get_git_parser,
-        get_github_download_parser,
-        get_venv_parser,
-    )
-    for feature_parser in feature_parsers:
-        feature_parser(subparsers, formatter_class=formatter_class)
+    # Only the parser of the chosen feature is created (or all if help is shown)
+    subparsers = parser.add_subparsers(dest="feature", action=LazySubParsersAction)
+
+    feature_parsers = {
+        "create": get_creator_parser,
+        "git": get_git_parser,
+        "github-download": get_github_download_parser,
+        "venv": get_venv_parser,
+    }
+    for name, feature_parser in feature_parsers.items():
+        subparsers.add_lazy_parser(
+            name, feature_parser, formatter_class=formatter_class
+        )
 
     args = parser.parse_args()
     match args.feature:
         case "create":
             if args.list_licenses:
                 try:
-                    list_licenses_mode()
+                    list_licenses_mode(prefetch=args.prefetch)
                 except ImportError as err:
                     logger.error(err, exc_info=True)
             else:
@@ -4,10 +4,44 @@ Module for general command line interface (CLI) tools.
 Includes tools to:
 - Achive a consistent formatting for argparse help.
 - Create the template code for a function that adds a parser as standalone or subparser.
+- Create subparsers only when they are needed.
 - Get the result of a prompt according to a mode (so you can auto run user decisions).
 """
 
 import argparse
+import textwrap
+from string import Template
+
+# Suffix of a help text that prevents the final punctuation of ConsistentFormatter
+_NOPERIOD = "<FORMATTER:NOPERIOD>"
+# Punctuation marks a help text may end with
+_END_PUNCT = (".", "!", "?")
+
+# Docstring of the generated parser functions, parsed once and filled per call (do not
+# indent the code here since this breaks the final string result)
+PARSER_DOCSTRING_TEMPLATE = Template('''"""
+Create and configure the argument parser for '${feature_name}'.
+
+This function can either add a subparser to an existing ArgumentParser
+(via `subparsers`) or create a standalone parser when called independently.
+Useful for modular CLI designs.
+
+Parameters
+----------
+subparsers : argparse._SubParsersAction, optional
+    Subparsers object from the main parser to which this parser should be added.
+    If None, a standalone ArgumentParser is created instead.
+prog : str, optional
+    The program name used in standalone mode. Ignored if `subparsers` is provided.
+formatter_class : type, optional
+    The formatter class to be used for argument help formatting. Defaults to
+    argparse.ArgumentDefaultsHelpFormatter.
+
+Returns
+-------
+argparse.ArgumentParser
+    The configured argument parser (necessary esp. for standalone mode).
+"""''')
 
 
 class ConsistentFormatter(argparse.HelpFormatter):
@@ -82,8 +116,6 @@ class ConsistentFormatter(argparse.HelpFormatter):
         This is a mixture between argparse.HelpFormatter and
         argparse.RawDescriptionHelpFormatter.
         """
-        import textwrap
-
         return textwrap.fill(
             self._make_sentence_style(text),
             width,
@@ -97,19 +129,80 @@ class ConsistentFormatter(argparse.HelpFormatter):
     @staticmethod
     def _make_sentence_style(text: str) -> str:
         """Enforce a capital letter at the beginning and a punctuation at the end."""
-        if text:
-            # Cannot use `.capitalize()` since it deletes uppercase words
-            text = text[0].upper() + text[1:]
-
-        if not text.endswith((".", "!", "?")):
-            if text.endswith("<FORMATTER:NOPERIOD>"):
-                text = text.removesuffix("<FORMATTER:NOPERIOD>").rstrip()
+        if not text:
+            return "."
+        if text[0].isupper() and text.endswith(_END_PUNCT):
+            # Most help texts are already in sentence style, no need to rebuild them
+            return text
+
+        # Cannot use `.capitalize()` since it deletes uppercase words
+        text = text[0].upper() + text[1:]
+
+        if not text.endswith(_END_PUNCT):
+            if text.endswith(_NOPERIOD):
+                text = text.removesuffix(_NOPERIOD).rstrip()
             else:
                 text += "."
 
         return text
 
 
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that creates the subparsers only when they are needed.
+
+    Register a subparser with `add_lazy_parser(name, create_parser, **kwargs)`, where
+    `create_parser(subparsers, **kwargs)` adds the subparser with the given name (e.g.
+    a function created with `generate_parser_template()`). It is only called if the
+    subcommand is used or if the help of the main parser is shown.
+
+    Examples
+    --------
+    Use it for the subparsers of the main parser:
+        subparsers = parser.add_subparsers(action=LazySubParsersAction)
+        subparsers.add_lazy_parser("create", get_creator_parser)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_parsers = {}
+
+    def add_lazy_parser(self, name: str, create_parser: callable, **kwargs) -> None:
+        """
+        Register a subparser that is created on first use.
+
+        Parameters
+        ----------
+        name : str
+            Name of the subcommand (must match the name used by 'create_parser').
+        create_parser : callable
+            Function that adds the subparser, called as `create_parser(self, **kwargs)`.
+        **kwargs
+            Keyword arguments passed to 'create_parser'.
+        """
+        self._lazy_parsers[name] = (create_parser, kwargs)
+        # Placeholder, so that argparse already accepts the name as a valid choice
+        self._name_parser_map[name] = None
+
+    def _create_lazy_parser(self, name: str) -> None:
+        """Create a registered subparser (replaces the placeholder)."""
+        create_parser, kwargs = self._lazy_parsers.pop(name)
+        del self._name_parser_map[name]
+        create_parser(self, **kwargs)
+
+    def _get_subactions(self) -> list[argparse.Action]:
+        """Create all registered subparsers (needed for the help of the main parser)."""
+        for name in list(self._lazy_parsers):
+            self._create_lazy_parser(name)
+        return super()._get_subactions()
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        """Create the chosen subparser (if registered) and let it parse the rest."""
+        if values and values[0] in self._lazy_parsers:
+            self._create_lazy_parser(values[0])
+        super().__call__(parser, namespace, values, option_string=option_string)
+
+
 def generate_parser_template(feature_name: str, groups: dict, n_tab: int = 4) -> str:
     """
     Generate a template for an argparse-based feature parser with grouped arguments.
@@ -142,30 +235,8 @@ def generate_parser_template(feature_name: str, groups: dict, n_tab: int = 4) ->
     func_name = f"get_{feature_name}_parser"
     description = f"{feature_name.capitalize()} does something useful"
 
-    # Docstring (do not indent the code here since this breaks the final string result)
-    docstring = f'''"""
-Create and configure the argument parser for '{feature_name}'.
-
-This function can either add a subparser to an existing ArgumentParser
-(via `subparsers`) or create a standalone parser when called independently.
-Useful for modular CLI designs.
-
-Parameters
-----------
-subparsers : argparse._SubParsersAction, optional
-    Subparsers object from the main parser to which this parser should be added.
-    If None, a standalone ArgumentParser is created instead.
-prog : str, optional
-    The program name used in standalone mode. Ignored if `subparsers` is provided.
-formatter_class : type, optional
-    The formatter class to be used for argument help formatting. Defaults to
-    argparse.ArgumentDefaultsHelpFormatter.
-
-Returns
--------
-argparse.ArgumentParser
-    The configured argument parser (necessary esp. for standalone mode).
-"""'''
+    # Docstring
+    docstring = PARSER_DOCSTRING_TEMPLATE.substitute(feature_name=feature_name)
 
     # Body
     body_lines = [
@@ -198,7 +269,7 @@ argparse.ArgumentParser
             if isinstance(arg, str):
                 arg_str = f'"{arg}"'
             else:
-                arg_str = ", ".join([f'"{this_arg}"' for this_arg in arg])
+                arg_str = ", ".join(f'"{this_arg}"' for this_arg in arg)
             body_lines.append(f'{tab}group.add_argument({arg_str}, help="{help_text}")')
         body_lines.append("")
 
@@ -219,3 +290,52 @@ def get_prompt_bool(message: str, mode: str, auto_decision: bool = False) -> boo
         case "ask" | _:
             user_input = input(f"{message} (Y/n): ")
             return user_input == "Y"
+
+
+def get_prompt_bools(
+    messages: list[str], mode: str, auto_decisions: list[bool] | None = None
+) -> list[bool]:
+    """
+    Return True/False for several prompts according to mode or a single user input.
+
+    In 'ask' mode, all questions are shown at once and answered in a single line,
+    either with one answer for all ('Y' or 'n') or with comma-separated answers
+    for each question (e.g. 'Y,n,Y').
+
+    Parameters
+    ----------
+    messages : list of str
+        Questions to ask.
+    mode : str
+        Prompt mode, see `get_prompt_bool`.
+    auto_decisions : list of bool, optional
+        Decisions used in 'auto' mode (default is False for each question).
+
+    Returns
+    -------
+    list of bool
+        Decision for each question.
+    """
+    if auto_decisions is None:
+        auto_decisions = [False] * len(messages)
+    if mode in ("yes", "no", "auto"):
+        return [
+            get_prompt_bool(message, mode, auto_decision=auto_decision)
+            for message, auto_decision in zip(messages, auto_decisions, strict=True)
+        ]
+    if len(messages) <= 1:
+        return [get_prompt_bool(message, mode) for message in messages]
+
+    questions = "\n".join(
+        f"{number}. {message}" for number, message in enumerate(messages, start=1)
+    )
+    user_input = input(
+        f"{questions}\nAnswer all (Y/n) or each separated by commas (e.g. Y,n,...): "
+    )
+    answers = [answer.strip() for answer in user_input.split(",")]
+    if len(answers) == 1:
+        answers *= len(messages)
+    elif len(answers) != len(messages):
+        answers = answers[: len(messages)]
+        answers += ["n"] * (len(messages) - len(answers))
+    return [answer == "Y" for answer in answers]
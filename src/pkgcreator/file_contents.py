@@ -10,22 +10,71 @@ Includes tools to:
     - .gitignore
 """
 
-from datetime import datetime
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from functools import lru_cache
 from pathlib import Path
 from sys import version_info
 
 from pkgcreator import ProjectSettings
-from pkgcreator.filetypes import Readme, Toml
+from pkgcreator.ghutils import (
+    REQUEST_TIMEOUT,
+    get_api_json,
+    get_cache_dir,
+    get_session,
+    json_loads,
+)
 from pkgcreator.logging_tools import logger
 
 # There is a soft dependency on "requests" for get_available_licenses()/get_license()
 
-
-class FileContent(dict):
+LICENSES_API_URL = (
+    "https://api.github.com/repos/github/choosealicense.com/contents/_licenses"
+)
+LICENSES_TARBALL_URL = (
+    "https://api.github.com/repos/github/choosealicense.com/tarball/HEAD"
+)
+LICENSES_RAW_URL = (
+    "https://raw.githubusercontent.com/github/choosealicense.com/HEAD"
+    "/_licenses/{name}.txt"
+)
+LICENSES_CACHE_TTL = 24 * 60 * 60  # seconds
+CONTENT_CACHE_SIZE = 48  # file contents kept by FileContent (up to 3 per settings)
+
+# Static templates are parsed only once, rendering is a simple substitution
+MAIN_PY_TEMPLATE = (
+    "def main():\n"
+    '    """Entry point for "{name}" and "python -m {name}"."""\n'
+    "\n"
+    "\n"
+    'if __name__ == "__main__":\n'
+    "    main()\n"
+)
+MIN_PYTHON = f"{version_info.major}.{version_info.minor:02}"
+
+# Constant content, encoded only once
+GITIGNORE = (
+    "__pycache__\n"
+    "#.gitignore\n"
+    ".env\n"
+    ".venv\n"
+    ".vscode\n"
+    ".draft*\n"
+    ".playground*\n"
+    "*.egg-info"
+)
+GITIGNORE_BYTES = GITIGNORE.encode("utf-8")
+
+
+class FileContent(MutableMapping):
     """
     Provides file contents for standard package files based on project settings.
 
-    Acts like a dictionary, where filenames are keys and their contents are values.
+    Acts like a dictionary, where filenames are keys and their contents are values
+    (the contents are stored in a plain dict, the instances themselves use slots).
     Use keyword arguments to override default content or add custom files.
 
     Examples
@@ -47,37 +96,135 @@ class FileContent(dict):
     -----
     Default files include:
         `.gitignore`, `LICENSE`, `pyproject.toml`, `README.md`, and `__main__.py`.
+
+    When creating many packages with different licenses, download the license texts
+    once beforehand, either all with `get_all_licenses_bulk()` or a selection with
+    `prefetch_licenses()`, and pass the text via `LICENSE=...`.
     """
 
+    __slots__ = ("project_settings", "license_name", "_cache_key", "_files")
+
+    # Generated contents shared by all instances (least recently used are dropped
+    # first), see `_get_cached()`
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(self, project_settings: ProjectSettings, **kwargs) -> None:
         self.project_settings = project_settings
-        kwargs.setdefault(".gitignore", self.get_gitignore())
-        kwargs.setdefault("LICENSE", self.get_license())
-        try:
-            self.license_name = kwargs["LICENSE"].splitlines()[0]
-        except Exception as _err:
-            self.license_name = "LICENSENAME"
-        kwargs.setdefault("pyproject.toml", self.get_pyproject_toml())
-        kwargs.setdefault("README.md", self.get_readme())
+        self._cache_key = project_settings.cache_key
+        kwargs.setdefault(".gitignore", GITIGNORE)
+        if "LICENSE" not in kwargs:
+            kwargs["LICENSE"] = self._get_cached("LICENSE", self.get_license)
+        license_text = kwargs["LICENSE"]
+        if isinstance(license_text, bytes):
+            license_text = license_text.decode("utf-8")
+        first_line, _, _ = license_text.partition("\n")
+        self.license_name = first_line.rstrip("\r") or "LICENSENAME"
+        if "pyproject.toml" not in kwargs:
+            kwargs["pyproject.toml"] = self._get_cached(
+                "pyproject.toml", self.get_pyproject_toml
+            )
+        if "README.md" not in kwargs:
+            kwargs["README.md"] = self._get_cached(
+                "README.md", self.get_readme, self.license_name
+            )
         kwargs.setdefault("__main__.py", self.get_main_py())
-        super().__init__(**kwargs)
+        self._files = kwargs
+
+    def __getitem__(self, filename: str) -> str | bytes:
+        return self._files[filename]
+
+    def __setitem__(self, filename: str, content: str | bytes) -> None:
+        self._files[filename] = content
+
+    def __delitem__(self, filename: str) -> None:
+        del self._files[filename]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._files!r})"
+
+    def encoded(self, encoding: str = "utf-8") -> dict[str, bytes]:
+        """
+        Return the file contents encoded to bytes (e.g. to write them directly).
+
+        The default `.gitignore` is encoded only once (for UTF-8), already encoded
+        contents are passed through unchanged.
+
+        Parameters
+        ----------
+        encoding : str, optional
+            Encoding of the text contents (default: 'utf-8').
+
+        Returns
+        -------
+        dict of bytes
+            Mapping of filenames to encoded contents.
+        """
+        encoded = {}
+        for filename, content in self._files.items():
+            if isinstance(content, bytes):
+                encoded[filename] = content
+            elif content is GITIGNORE and encoding == "utf-8":
+                encoded[filename] = GITIGNORE_BYTES
+            else:
+                encoded[filename] = content.encode(encoding)
+        return encoded
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the contents cached for identical project settings."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def _get_cached(self, filename: str, create_content: callable, *key) -> str:
+        """
+        Return the content of a file, but create it only once for identical settings.
+
+        At most `CONTENT_CACHE_SIZE` contents are kept.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        create_content : callable
+            Function that returns the content of the file.
+        *key
+            Additional values the content depends on.
+
+        Returns
+        -------
+        str
+            Content of the file (empty contents, e.g. failed downloads, are not cached).
+        """
+        cache_key = (filename, self._cache_key, *key)
+        with self._cache_lock:
+            if (content := self._cache.get(cache_key)) is not None:
+                self._cache.move_to_end(cache_key)
+                return content
+
+        content = create_content()
+        if content:
+            with self._cache_lock:
+                self._cache[cache_key] = content
+                if len(self._cache) > CONTENT_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return content
 
     @staticmethod
     def get_gitignore() -> str:
         """Return default content for '.gitignore'."""
-        return (
-            "__pycache__\n"
-            "#.gitignore\n"
-            ".env\n"
-            ".venv\n"
-            ".vscode\n"
-            ".draft*\n"
-            ".playground*\n"
-            "*.egg-info"
-        )
+        return GITIGNORE
 
     def get_license(self) -> str:
         """Return license text according to 'project_settings.license_id'."""
+        from datetime import date
+
         project = self.project_settings
         if project.license_id is None:
             return ""
@@ -92,7 +239,7 @@ class FileContent(dict):
 
         try:
             license_text = license_text.replace("[fullname]", project.author_name)
-            license_text = license_text.replace("[year]", str(datetime.today().year))
+            license_text = license_text.replace("[year]", str(date.today().year))
         except Exception as err:
             logger.error(err, exc_info=True)
             logger.warning("Could not set author/year in license text", exc_info=True)
@@ -102,12 +249,6 @@ class FileContent(dict):
     def get_pyproject_toml(self) -> str:
         """Return default value for 'pyproject.toml' according to 'project_settings'."""
         project = self.project_settings
-        try:
-            min_python = f"{version_info.major}.{version_info.minor:02}"
-        except Exception as err:
-            min_python = "3.00"
-            logger.warning(err, exc_info=True)
-
         content = {
             "name": project.name,
             "version": "0.1.0",
@@ -118,11 +259,13 @@ class FileContent(dict):
             "maintainers": [
                 {"name": project.author_name, "email": project.author_mail}
             ],
-            "requires-python": f">={min_python}",
+            "requires-python": f">={MIN_PYTHON}",
             "dependencies": project.dependencies,
             "classifiers": project.classifiers,
         }
 
+        from pkgcreator.filetypes import Toml
+
         toml = Toml()
         toml.add_heading("project")
         toml.add_easy(content)
@@ -139,6 +282,8 @@ class FileContent(dict):
 
     def get_readme(self) -> str:
         """Return default value for 'README' according to 'project_settings'."""
+        from pkgcreator.filetypes import Readme
+
         project = self.project_settings
         # Create Readme object and define the links needed later
         file = Readme()
@@ -167,70 +312,220 @@ class FileContent(dict):
         # List of features
         file.add_heading("Features", level=1, to_toc=False)
         file.add_toc()
-        for feature in [f"Feature {idx}" for idx in range(5)]:
+        for idx in range(5):
+            feature = f"Feature {idx}"
             file.add_heading(feature, level=2)
             file.add_text(f"Description for feature {feature}")
         file.add_toc(clear=True)
 
         # Requirements
         file.add_heading("Requirements", level=1, to_toc=False)
-        file.add_list(*[f"required-package-{idx}" for idx in range(5)])
+        file.add_list(*(f"required-package-{idx}" for idx in range(5)))
 
         return file.content
 
     def get_main_py(self) -> str:
         """Get basic content for __main__.py."""
-        name = self.project_settings.name
-        tab = f"{'':4}"
-        return "\n".join(
-            [
-                "def main():",
-                f'{tab}"""Entry point for "{name}"and "python -m {name}"."""',
-                "",
-                "",
-                'if __name__ == "__main__":',
-                f"{tab}main()",
-                "",
-            ]
-        )
-
-
-def get_available_licenses(api_url: str | None = None) -> str:
+        return MAIN_PY_TEMPLATE.format_map({"name": self.project_settings.name})
+
+
+@lru_cache(maxsize=4)
+def get_available_licenses(api_url: str | None = None) -> dict[str, str]:
     """
     Get available license form the 'choosealicense.com' repository.
 
     You may specify a different GitHub repository by changing the 'api_url'.
+    The result is cached in memory and on disk (see `get_licenses_cache_file()`) for
+    `LICENSES_CACHE_TTL` seconds, use `invalidate_cache()` to force a new download.
     """
-    import requests  # Soft dependency (violates PEP 8 on purpose)
-
     if api_url is None:
-        api_url = (
-            "https://api.github.com/repos/github/choosealicense.com/contents/_licenses"
-        )
+        api_url = LICENSES_API_URL
 
-    response = requests.get(api_url)
-    response.raise_for_status()
-    contents = response.json()
+    cache_file = get_licenses_cache_file(api_url)
+    if (licenses := _read_licenses_cache(cache_file)) is not None:
+        return licenses
+
+    files = (item for item in get_api_json(api_url) if item["type"] == "file")
 
-    return {
-        str(Path(item["name"]).with_suffix("")): item["download_url"]
-        for item in contents
-        if item["type"] == "file"
+    licenses = {
+        os.path.splitext(item["name"])[0]: item["download_url"] for item in files
     }
+    _write_licenses_cache(cache_file, licenses)
+
+    return licenses
+
+
+def get_licenses_cache_file(api_url: str | None = None) -> Path:
+    """Return the cache file used by `get_available_licenses()` for the 'api_url'."""
+    if api_url is None or api_url == LICENSES_API_URL:
+        return get_cache_dir() / "licenses.json"
+    # Other repositories get their own file (without using characters like '/')
+    name = "".join(char if char.isalnum() else "_" for char in api_url)
+    return get_cache_dir() / f"licenses_{name}.json"
+
+
+def invalidate_cache() -> None:
+    """Clear the in-memory and on-disk caches of the licenses."""
+    get_available_licenses.cache_clear()
+    get_all_licenses_bulk.cache_clear()
+    _download_license.cache_clear()
+    for cache_file in get_cache_dir().glob("licenses*.json"):
+        try:
+            cache_file.unlink()
+        except OSError as err:
+            logger.debug(f"Could not remove cache file '{cache_file}': {err}")
+
+
+def _read_licenses_cache(cache_file: Path) -> dict[str, str] | None:
+    """Return the cached licenses if the cache file exists and is not outdated."""
+    try:
+        if time.time() - cache_file.stat().st_mtime > LICENSES_CACHE_TTL:
+            return None
+        return json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_licenses_cache(cache_file: Path, licenses: dict[str, str]) -> None:
+    """Write the licenses to the cache file (failing is not critical)."""
+    import json
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(licenses), encoding="utf-8")
+    except OSError as err:
+        logger.debug(f"Could not write cache file '{cache_file}': {err}")
 
 
 def get_license(name: str, licenses: dict | None = None) -> str:
-    """Download the chosen licenses."""
-    import requests  # Soft dependency (violates PEP 8 on purpose)
+    """
+    Download the chosen licenses.
 
+    If 'licenses' is None and no list of the available licenses is cached on disk,
+    the text is downloaded directly from `LICENSES_RAW_URL` (one request instead of
+    two, listing the licenses is not necessary when the name is known).
+    """
     if licenses is None:
-        licenses = get_available_licenses()
-    download_url = licenses[name]
-    response = requests.get(download_url)
+        licenses = _read_licenses_cache(get_licenses_cache_file())
+        if licenses is None:
+            return _download_license(LICENSES_RAW_URL.format(name=name))
+    return _download_license(licenses[name])
+
+
+@lru_cache(maxsize=16)
+def _download_license(download_url: str) -> str:
+    """Download a license text (cached, the texts do not change within a session)."""
+    response = get_session().get(download_url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
 
-    text = response.text
-    try:
-        return text.split("\n---\n")[1].lstrip("\n")
-    except IndexError:
-        return text
+    return _strip_front_matter(response.text)
+
+
+def start_license_download(name: str):
+    """
+    Start downloading a license in a background thread.
+
+    The text is stored in the cache of `get_license()`, so that a later call (e.g. by
+    `FileContent`) does not have to wait for the network. Errors are logged as
+    warning, the later call raises them again.
+
+    Parameters
+    ----------
+    name : str
+        Name of the license to download.
+
+    Returns
+    -------
+    threading.Thread
+        The started thread (join it before using the license).
+    """
+
+    def download() -> None:
+        try:
+            get_license(name)
+        except Exception as err:
+            logger.warning(f"Background download of license '{name}' failed: {err}")
+
+    thread = threading.Thread(target=download, daemon=True)
+    thread.start()
+
+    return thread
+
+
+def prefetch_licenses(
+    names: list[str], licenses: dict | None = None, max_workers: int = 8
+) -> dict[str, str]:
+    """
+    Download several licenses in parallel.
+
+    The downloads are network-bound, so a thread pool overlaps their latency.
+
+    Parameters
+    ----------
+    names : list of str
+        Names of the licenses to download.
+    licenses : dict, optional
+        Mapping of license names to download URLs (see `get_available_licenses()`).
+    max_workers : int, optional
+        Maximum number of parallel downloads (default: 8).
+
+    Returns
+    -------
+    dict of str
+        Mapping of license names to license texts.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = list(names)
+    if licenses is None:
+        licenses = get_available_licenses()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        texts = executor.map(lambda name: get_license(name, licenses), names)
+        return dict(zip(names, texts, strict=True))
+
+
+@lru_cache(maxsize=1)
+def get_all_licenses_bulk(tarball_url: str | None = None) -> dict[str, str]:
+    """
+    Get the texts of all licenses from 'choosealicense.com' with a single download.
+
+    Instead of downloading each license on its own, the repository is downloaded as
+    tarball (streamed, nothing is written to disk) and the license texts are
+    extracted from its '_licenses' folder. The result is cached in memory.
+
+    Parameters
+    ----------
+    tarball_url : str, optional
+        URL of the repository tarball (default: 'choosealicense.com' repository).
+
+    Returns
+    -------
+    dict of str
+        Mapping of license names to license texts.
+    """
+    import tarfile
+
+    if tarball_url is None:
+        tarball_url = LICENSES_TARBALL_URL
+
+    licenses = {}
+    session = get_session()
+    with session.get(tarball_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+            for member in tar:
+                parts = member.name.split("/")
+                if not member.isfile() or len(parts) < 2 or parts[-2] != "_licenses":
+                    continue
+                name, suffix = os.path.splitext(parts[-1])
+                if suffix != ".txt" or (file := tar.extractfile(member)) is None:
+                    continue
+                licenses[name] = _strip_front_matter(file.read().decode("utf-8"))
+
+    return licenses
+
+
+def _strip_front_matter(text: str) -> str:
+    """Return the license text without the YAML front matter (if present)."""
+    _, separator, body = text.partition("\n---\n")
+    return body.lstrip("\n") if separator else text
@@ -6,6 +6,13 @@ Includes tools to write:
 - Toml (pyproject.toml)
 """
 
+# Prefixes of the Markdown headings, index is the heading level
+_HEADING_PREFIXES = tuple(f"{'#' * (level + 1)} " for level in range(6))
+# Characters replaced by "-" in the anchors of internal links
+_LINK_TABLE = str.maketrans({" ": "-", "_": "-"})
+# Methods used by `Toml.add_easy()` for the exact type of a value
+_EASY_METHODS = {list: "add_list", dict: "add_dictionary"}
+
 
 class BaseFileType:
     """
@@ -41,7 +48,7 @@ class BaseFileType:
     @property
     def content(self) -> str:
         """Get the file content."""
-        return self.newline.join(self.lines)
+        return self.newline.join(self._lines)
 
 
 class Readme(BaseFileType):
@@ -51,6 +58,8 @@ class Readme(BaseFileType):
 
     def __init__(self, *args, **kwargs) -> None:
         self._headings = []
+        # Position of the TOC mark (see `add_toc()`), None if there is no mark
+        self._toc_mark_idx = None
         super().__init__(*args, **kwargs)
 
     def add_text(self, *lines: str, bold: bool = False) -> None:
@@ -64,9 +73,10 @@ class Readme(BaseFileType):
         bold : bool, optional
             Whether to bold the text (default is False).
         """
-        for text in lines:
-            final_text = self.bold(text) if bold else text
-            self._lines.append(final_text)
+        if bold:
+            self._lines.extend(self.bold(text) for text in lines)
+        else:
+            self._lines.extend(lines)
 
     def add_heading(self, text: str, level: int = 0, to_toc: bool = True) -> None:
         """
@@ -85,7 +95,11 @@ class Readme(BaseFileType):
             _start = self.newline
         else:
             _start = ""
-        self._lines.append(f'{_start}{"#"*(level+1)} {text}{self.newline}')
+        if 0 <= level < len(_HEADING_PREFIXES):
+            prefix = _HEADING_PREFIXES[level]
+        else:
+            prefix = f"{'#' * (level + 1)} "
+        self._lines.append(f"{_start}{prefix}{text}{self.newline}")
         if to_toc:
             self._headings.append(text)
 
@@ -103,15 +117,16 @@ class Readme(BaseFileType):
             Indentation level (default is 0).
         """
         if ordered:
-            for idx, item in enumerate(items):
-                self._lines.append(self.listitem(item, index=idx, level=level))
+            self._lines.extend(
+                self.listitem(item, index=idx, level=level)
+                for idx, item in enumerate(items)
+            )
         else:
-            for item in items:
-                self._lines.append(self.listitem(item, level=level))
+            self._lines.extend(self.listitem(item, level=level) for item in items)
 
     def add_named_list(
         self,
-        content: dict[str],
+        content: dict[str, str],
         ordered: bool = False,
         level: int = 0,
         bold_name: bool = True,
@@ -131,9 +146,9 @@ class Readme(BaseFileType):
             Whether to bold the keys (default is True).
         """
         if bold_name:
-            items = [f"{self.bold(name)}: {value}" for name, value in content.items()]
+            items = (f"{self.bold(name)}: {value}" for name, value in content.items())
         else:
-            items = [f"{name}: {value}" for name, value in content.items()]
+            items = (f"{name}: {value}" for name, value in content.items())
         self.add_list(*items, ordered=ordered, level=level)
 
     def add_rule(self) -> None:
@@ -175,19 +190,29 @@ class Readme(BaseFileType):
             return
 
         identifier = "<<MARK-FOR-TOC>>"
-        try:
-            idx = self.lines.index(identifier)
-            toc = self.get_toc()
-            try:
-                if self._lines[idx + 1].startswith(self.newline):
-                    toc = toc.removesuffix(self.newline)
-            except IndexError:
-                pass
-            self._lines[idx] = toc
-            if clear:
-                self._headings = []
-        except ValueError:
+        idx = self._toc_mark_idx
+        if idx is None:
+            self._toc_mark_idx = len(self._lines)
             self._lines.append(identifier)
+            return
+
+        self._toc_mark_idx = None
+        if idx >= len(self._lines) or self._lines[idx] != identifier:
+            # The lines were changed from outside, search the mark again
+            idx = self._lines.index(identifier) if identifier in self._lines else None
+        toc = self.get_toc()
+        if idx is None:
+            # The mark was removed, place the TOC at the end instead
+            self._lines.append(toc)
+        else:
+            next_idx = idx + 1
+            if next_idx < len(self._lines) and self._lines[next_idx].startswith(
+                self.newline
+            ):
+                toc = toc.removesuffix(self.newline)
+            self._lines[idx] = toc
+        if clear:
+            self._headings = []
 
     def get_toc(self) -> str:
         """
@@ -272,7 +297,7 @@ class Readme(BaseFileType):
         str
             Anchor link for internal use.
         """
-        return f'#{text.lower().replace(" ", "-").replace("_", "-")}'
+        return f"#{text.translate(_LINK_TABLE).lower()}"
 
     @classmethod
     def listitem(cls, text: str, index: int | None = None, level: int = 0) -> str:
@@ -350,7 +375,7 @@ class Toml(BaseFileType):
             return
         # Multinline list
         self._lines.append(self.variable(name, "[", bare_value=True))
-        self._lines += [f"{self.tab}{item}," for item in content]
+        self._lines.extend(f"{self.tab}{item}," for item in content)
         self._lines.append("]")
 
     def add_variable(self, name: str, value: str) -> None:
@@ -376,12 +401,16 @@ class Toml(BaseFileType):
             Dictionary of variables to insert, type inferred.
         """
         for name, value in content.items():
-            if isinstance(value, list):
-                self.add_list(name, value)
-            elif isinstance(value, dict):
-                self.add_dictionary(name, value)
-            else:
-                self.add_variable(name, value)
+            method = _EASY_METHODS.get(type(value))
+            if method is None:
+                # Subclasses of list or dict are rare, so they are only checked here
+                if isinstance(value, list):
+                    method = "add_list"
+                elif isinstance(value, dict):
+                    method = "add_dictionary"
+                else:
+                    method = "add_variable"
+            getattr(self, method)(name, value)
 
     @classmethod
     def dictionary(cls, items: dict) -> str:
@@ -398,8 +427,8 @@ class Toml(BaseFileType):
         str
             TOML dictionary.
         """
-        content = [cls.variable(name, value) for name, value in items.items()]
-        return "{" + ", ".join(content) + "}"
+        content = ", ".join(cls.variable(name, value) for name, value in items.items())
+        return f"{{{content}}}"
 
     @staticmethod
     def variable(name: str, value: str, bare_value: bool = False) -> str:
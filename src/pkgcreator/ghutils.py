@@ -7,11 +7,267 @@ Includes tools to:
 - Download (a part of) the content of a GitHub repository.
 """
 
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 
 from pkgcreator.logging_tools import logger
 
-# There is a soft dependency on "requests" for GithubRepository().download()
+# There is a soft dependency on "requests" for GithubRepository().download(), it is
+# only imported once by `get_session()`
+
+REQUEST_TIMEOUT = 10  # seconds
+DOWNLOAD_WORKERS = 16  # files downloaded in parallel by GithubRepository.download()
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes written at once when streaming a file
+DOWNLOAD_PROGRESS_STEP = 20  # files between two progress messages of a download
+RATE_LIMIT_MAX_WAIT = 60  # seconds to wait at most for a reset of the rate limit
+API_CACHE_TTL = 7 * 24 * 3600  # seconds a cached API response is used at most
+API_CACHE_SIZE = 256  # cached API responses kept at most (the oldest are removed)
+GITHUB_API_URL = "https://api.github.com/"
+# Git file mode of symbolic links (listed as blobs by the trees API)
+_SYMLINK_MODE = "120000"
+# Flags to (over)write a downloaded file (binary mode is only relevant on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Suffixes of the repository URL for the logical names of GithubRepository.get_url()
+_URL_SUFFIXES = {
+    None: "",
+    "repository": "",
+    "download": "",
+    "homepage": "",
+    "changelog": "/commits",
+    "releasenotes": "/commits",
+    "documentation": "/README.md",
+    "issues": "/issues",
+    "source": ".git",
+}
+# Suffixes of the API URL for the logical names of GithubRepository.get_api_url()
+_API_URL_SUFFIXES = {"content": "/contents", "contents": "/contents"}
+
+
+@lru_cache(maxsize=1)
+def _get_json_parser():
+    """Import the JSON parser on first use (only needed for network responses)."""
+    try:
+        from orjson import loads  # Optional, faster JSON parser
+    except ImportError:
+        from json import loads
+
+    return loads
+
+
+def json_loads(data: bytes | str):
+    """Parse JSON data (with 'orjson' if available, otherwise with 'json')."""
+    return _get_json_parser()(data)
+
+
+def get_cache_dir() -> Path:
+    """Return the user cache directory of pkgcreator (respects 'XDG_CACHE_HOME')."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / "pkgcreator"
+
+
+def get_api_json(url: str):
+    """
+    Get the JSON response of a GitHub API URL, revalidated with a cached ETag.
+
+    Responses with an ETag are cached on disk (for `API_CACHE_TTL` seconds, at most
+    `API_CACHE_SIZE` responses). Later requests send the ETag, and if GitHub answers
+    with "304 Not Modified" (which does not count against the rate limit), the cached
+    response is used.
+
+    If the environment variable 'GITHUB_TOKEN' is set, it is used to authenticate at
+    the GitHub API (raising the rate limit). Authenticated responses are not cached,
+    since they may contain data that is not visible without the token. If the rate
+    limit is exceeded and resets within `RATE_LIMIT_MAX_WAIT` seconds, the request is
+    repeated after the reset.
+
+    Parameters
+    ----------
+    url : str
+        GitHub API URL.
+
+    Returns
+    -------
+    list or dict
+        Parsed JSON response.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the `requests` library is not installed.
+    HTTPError
+        If the request fails.
+    """
+    from hashlib import sha1
+
+    headers = {"Accept": "application/vnd.github+json"}
+    # Only send the token to the GitHub API (the session is used for other hosts)
+    if url.startswith(GITHUB_API_URL) and (token := os.environ.get("GITHUB_TOKEN")):
+        headers["Authorization"] = f"Bearer {token}"
+        cache_file = cached = None
+    else:
+        cache_file = get_cache_dir() / "api" / f"{sha1(url.encode()).hexdigest()}.json"
+        if (cached := _read_api_cache(cache_file)) is not None:
+            headers["If-None-Match"] = cached["etag"]
+
+    session = get_session()
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if (wait := _get_rate_limit_wait(response)) is not None:
+        if wait <= RATE_LIMIT_MAX_WAIT:
+            logger.info(f"GitHub API rate limit exceeded, waiting {wait:.0f} s...")
+            time.sleep(wait + 1)
+            response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        else:
+            msg = (
+                f"GitHub API rate limit exceeded, it resets in {wait / 60:.0f} min "
+                "(set 'GITHUB_TOKEN' for a higher limit)"
+            )
+            logger.warning(msg)
+    if response.status_code == 304 and cached is not None:
+        logger.debug(f"Using cached response for '{url}'")
+        return json_loads(cached["body"])
+    response.raise_for_status()
+
+    if cache_file is not None and (etag := response.headers.get("ETag")):
+        _write_api_cache(cache_file, etag, response.text)
+
+    return json_loads(response.content)
+
+
+def get_file_sizes(directory: str | Path) -> dict[str, int]:
+    """Return the sizes of the files in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: entry.stat().st_size
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            }
+    except OSError:
+        return {}
+
+
+def git_blob_sha(file_path: str | Path) -> str:
+    """Return the SHA-1 of a file as computed by git for blobs (as listed by GitHub)."""
+    from hashlib import sha1
+
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        digest = sha1(f"blob {size}\0".encode())
+        while chunk := file.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _get_rate_limit_wait(response) -> float | None:
+    """Return the seconds until the rate limit resets, None if it was not exceeded."""
+    headers = response.headers
+    if response.status_code not in (403, 429):
+        return None
+    if retry_after := headers.get("Retry-After"):
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") != "0":
+        return None
+
+    return max(0.0, float(headers.get("X-RateLimit-Reset", 0)) - time.time())
+
+
+def _get_sha_to_compare(item: dict, local_sizes: dict[str, int], name: str):
+    """Return the SHA of a listed file if a local file of the same size exists."""
+    if local_sizes.get(name) != item.get("size"):
+        return None
+
+    return item.get("sha")
+
+
+def _read_api_cache(cache_file: Path) -> dict | None:
+    """Return the cached API response and its ETag, None if missing or expired."""
+    try:
+        if time.time() - cache_file.stat().st_mtime > API_CACHE_TTL:
+            return None
+        cached = json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or "etag" not in cached or "body" not in cached:
+        return None
+
+    return cached
+
+
+def _write_api_cache(cache_file: Path, etag: str, body: str) -> None:
+    """
+    Write an API response and its ETag to the cache file (may fail silently).
+
+    If the cache holds more than `API_CACHE_SIZE` responses afterwards, the oldest
+    are removed.
+    """
+    import json
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"etag": etag, "body": body}), encoding="utf-8"
+        )
+        with os.scandir(cache_file.parent) as entries:
+            files = [entry for entry in entries if entry.is_file()]
+        if len(files) > API_CACHE_SIZE:
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in files[: len(files) - API_CACHE_SIZE]:
+                os.remove(entry.path)
+    except OSError as err:
+        logger.debug(f"Could not write cache file '{cache_file}': {err}")
+
+
+@lru_cache(maxsize=1)
+def get_session():
+    """
+    Return a shared `requests.Session` with connection pooling and retries.
+
+    Reusing the session keeps the connections alive, so subsequent requests to the
+    same host skip the TCP and TLS handshakes.
+
+    Returns
+    -------
+    requests.Session
+        Session shared by all requests of pkgcreator.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the `requests` library is not installed.
+    """
+    import requests  # Soft dependency (violates PEP 8 on purpose)
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        # Keep a connection for each thread of GithubRepository.download()
+        pool_maxsize=max(8, DOWNLOAD_WORKERS),
+        # Also retry "429 Too Many Requests" (after the time the server asks for)
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429,),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    # Accept every compression urllib3 can decode (e.g. brotli if it is installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    return session
 
 
 class GithubRepository:
@@ -34,6 +290,7 @@ class GithubRepository:
 
     _base_url = "https://github.com"
     _base_api_url = "https://api.github.com/repos"
+    _base_raw_url = "https://raw.githubusercontent.com"
 
     def __init__(self, owner: str, repository: str, branch: str = "main") -> None:
         self._owner = owner
@@ -52,6 +309,17 @@ class GithubRepository:
         """str: Repository name."""
         return self._repository_name
 
+    @property
+    def branch(self) -> str:
+        """str: Branch targeted by default."""
+        return self._branch
+
+    @branch.setter
+    def branch(self, value: str) -> None:
+        self._branch = value
+        # Reference added to the URLs by default (see `_finalize_url()`)
+        self._branch_suffix = f"?ref={value}" if value else ""
+
     @property
     def url(self) -> str:
         """str: Public GitHub URL of the repository."""
@@ -82,22 +350,13 @@ class GithubRepository:
         str or None
             Constructed URL or None if the logical name is unknown.
         """
-        repo_url = self.url
-        match name:
-            case None | "repository" | "download" | "homepage":
-                url = repo_url
-            case "owner":
-                url = self._url_owner
-            case "changelog" | "releasenotes":
-                url = f"{repo_url}/commits"
-            case "documentation":
-                url = f"{repo_url}/README.md"
-            case "issues":
-                url = f"{repo_url}/issues"
-            case "source":
-                url = f"{repo_url}.git"
-            case "funding" | _:
-                return None
+        if name == "owner":
+            url = self._url_owner
+        elif (suffix := _URL_SUFFIXES.get(name)) is not None:
+            url = f"{self.url}{suffix}"
+        else:
+            # Unknown names and names without GitHub URL (e.g. "funding")
+            return None
 
         return self._finalize_url(url, add=add, branch=branch)
 
@@ -121,15 +380,60 @@ class GithubRepository:
         str or None
             Constructed API URL or None if unknown.
         """
-        repo_url = self.api_url
-        match name:
-            case "content" | "contents":
-                url = f"{repo_url}/contents"
-            case _:
-                return None
+        if (url := self._api_urls.get(name)) is None:
+            return None
 
         return self._finalize_url(url, add=add, branch=branch)
 
+    def get_raw_url(self, path: str, branch: str | None = None) -> str:
+        """
+        Get the URL of the raw content of a file in the repository.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file in the repository.
+        branch : str, optional
+            Branch to use. If None, defaults to self.branch.
+
+        Returns
+        -------
+        str
+            URL of the raw file content.
+        """
+        if branch is None:
+            branch = self.branch
+
+        return f"{self._base_raw_url}/{self.owner}/{self.name}/{branch}/{quote(path)}"
+
+    def tree(self, branch: str | None = None) -> dict:
+        """
+        Get the complete file tree of the repository with one request (Git trees API).
+
+        Parameters
+        ----------
+        branch : str, optional
+            Git branch to target. If None, defaults to self.branch.
+
+        Returns
+        -------
+        dict
+            API response, the entries are listed in 'tree' and 'truncated' is True if
+            the repository is too large to be listed completely.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the `requests` library is not installed.
+        HTTPError
+            If the request to the GitHub API fails.
+        """
+        if branch is None:
+            branch = self.branch
+        url = f"{self.api_url}/git/trees/{branch}?recursive=1"
+
+        return get_api_json(url)
+
     def contents(
         self,
         subfolder: str | None = None,
@@ -155,13 +459,9 @@ class GithubRepository:
         HTTPError
             If a request to the GitHub API or file URL fails.
         """
-        import requests  # Soft dependency (violates PEP 8 on purpose)
-
         # Get contents json from github api
         url = self.get_api_url(name="contents", add=subfolder, branch=branch)
-        response = requests.get(url)
-        response.raise_for_status()
-        contents = response.json()
+        contents = get_api_json(url)
 
         # Make sure contents is a list (esp. when there is only one item)
         if not isinstance(contents, list) and ensure_list:
@@ -175,10 +475,17 @@ class GithubRepository:
         subfolder: str | None = None,
         branch: str | None = None,
         recursively: bool = True,
+        max_workers: int = DOWNLOAD_WORKERS,
     ) -> None:
         """
         Download contents of the GitHub repository (or subfolder) via the API.
 
+        The folders are listed and their files are downloaded in parallel threads, so
+        the waiting times of the requests overlap. The complete repository is listed
+        with a single request instead (see `tree()`), unless it is too large or
+        'GITHUB_TOKEN' is set (the raw file URLs of the tree are not authenticated,
+        which fails for private repositories). Symbolic links are not downloaded.
+
         Parameters
         ----------
         destination : str or Path
@@ -189,6 +496,8 @@ class GithubRepository:
             Git branch to target. If None, defaults to self.branch.
         recursively : bool, optional
             Whether to download folders recursively (default: True).
+        max_workers : int, optional
+            Number of files downloaded in parallel (default: DOWNLOAD_WORKERS).
 
         Raises
         ------
@@ -197,42 +506,155 @@ class GithubRepository:
         HTTPError
             If a request to the GitHub API or file URL fails.
         """
-        import requests  # Soft dependency (violates PEP 8 on purpose)
-
-        # Get contents json from github api
-        contents = self.contents(subfolder=subfolder, branch=branch)
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        if subfolder is None and recursively and not os.environ.get("GITHUB_TOKEN"):
+            tree = self.tree(branch=branch)
+            if not tree.get("truncated"):
+                self._download_tree(tree["tree"], destination, branch, max_workers)
+                return
+            logger.debug("Repository tree is truncated, list the folders one by one")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Pending folder listings and their (destination, subfolder)
+            listings = {}
+            downloads = []
+
+            def list_folder(folder_destination: Path, folder: str | None) -> None:
+                listing = executor.submit(
+                    self.contents, subfolder=folder, branch=branch
+                )
+                listings[listing] = (folder_destination, folder)
+
+            list_folder(Path(destination), subfolder)
+            while listings:
+                done, _ = wait(listings, return_when=FIRST_COMPLETED)
+                for listing in done:
+                    # Get contents json from github api and make destination
+                    folder_destination, folder = listings.pop(listing)
+                    contents = listing.result()
+                    folder_destination.mkdir(parents=True, exist_ok=True)
+                    local_sizes = get_file_sizes(folder_destination)
+
+                    # Download files and list folders (if wanted) in the background
+                    for item in contents:
+                        name = item["name"]
+                        if item["type"] == "file":
+                            downloads.append(
+                                executor.submit(
+                                    self._download_file,
+                                    item["download_url"],
+                                    folder_destination / name,
+                                    sha=_get_sha_to_compare(item, local_sizes, name),
+                                )
+                            )
+                        elif item["type"] == "dir" and recursively:
+                            new_subfolder = f"{folder}/{name}" if folder else name
+                            list_folder(folder_destination / name, new_subfolder)
+
+            self._wait_for_downloads(downloads)
+
+    def _download_tree(
+        self,
+        tree: list[dict],
+        destination: str | Path,
+        branch: str | None = None,
+        max_workers: int = DOWNLOAD_WORKERS,
+    ) -> None:
+        """Download the files of a tree listed by `tree()` in parallel threads."""
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Make destination
         destination = Path(destination)
         destination.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            downloads = []
+            # Sizes of the existing files by folder, to find unchanged files quickly
+            local_sizes = {destination: get_file_sizes(destination)}
+            # The tree lists the folders before their content
+            for item in tree:
+                path = item["path"]
+                if item["type"] == "tree":
+                    (destination / path).mkdir(parents=True, exist_ok=True)
+                elif item.get("mode") == _SYMLINK_MODE:
+                    # The content of the blob is the target, not a file to write
+                    logger.debug(f"Skip symbolic link '{path}'")
+                elif item["type"] == "blob":
+                    file_path = destination / path
+                    if (sizes := local_sizes.get(file_path.parent)) is None:
+                        sizes = local_sizes[file_path.parent] = get_file_sizes(
+                            file_path.parent
+                        )
+                    downloads.append(
+                        executor.submit(
+                            self._download_file,
+                            self.get_raw_url(path, branch=branch),
+                            file_path,
+                            sha=_get_sha_to_compare(item, sizes, file_path.name),
+                        )
+                    )
 
-        # Download (recursively if wanted)
-        for item in contents:
-            name = item["name"]
-            if item["type"] == "file":
-                download_url = item["download_url"]
-                file_path = destination / name
-                logger.info(f"Downloading {name}...")
-                file_response = requests.get(download_url)
-                file_response.raise_for_status()
-                # The following line is fine, pathlib uses a proper context manager
-                file_path.write_bytes(file_response.content)
-            elif item["type"] == "dir" and recursively:
-                new_subfolder = f"{subfolder}/{name}" if subfolder else name
-                new_destination = destination / name
-                self.download(
-                    new_destination,
-                    subfolder=new_subfolder,
-                    recursively=recursively,
-                )
+            self._wait_for_downloads(downloads)
+
+    @staticmethod
+    def _wait_for_downloads(downloads: list) -> None:
+        """Wait for the downloads, log the progress and raise the errors (if any)."""
+        from concurrent.futures import as_completed
+
+        n_total = len(downloads)
+        for n_done, download in enumerate(as_completed(downloads), start=1):
+            download.result()
+            if n_done % DOWNLOAD_PROGRESS_STEP == 0 or n_done == n_total:
+                logger.info(f"Downloaded {n_done}/{n_total} files")
+
+    @staticmethod
+    def _download_file(
+        download_url: str, file_path: Path, sha: str | None = None
+    ) -> None:
+        """
+        Download a single file (used by the threads of `download()`).
+
+        The content is streamed to the file in chunks, so large files are never held
+        in memory completely. The chunks are written directly to the file descriptor
+        and, if the size is known, the file is allocated beforehand (where supported).
+        If 'sha' is given and matches the git blob SHA-1 of the existing file, the
+        file is unchanged and not downloaded again.
+        """
+        if sha is not None and git_blob_sha(file_path) == sha:
+            logger.debug("Skipping %s (unchanged)...", file_path)
+            return
+        # Called for every file, so only formatted if the message is shown
+        logger.debug("Downloading %s...", file_path)
+        session = get_session()
+        with session.get(
+            download_url, stream=True, timeout=REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            # With a content encoding, the length is not the size of the decoded file
+            if response.headers.get("Content-Encoding", "identity") == "identity":
+                size = int(response.headers.get("Content-Length") or 0)
+            else:
+                size = 0
+            fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+            try:
+                if size and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, size)
+                    except OSError:
+                        pass  # Not supported by the file system, just write
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    data = memoryview(chunk)
+                    while data:
+                        data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
 
     def get_contents_str(
         self,
         subfolder: str | None = None,
         branch: str | None = None,
         recursively: bool = True,
-        _level: int = 0,
-    ) -> list[dict]:
+        max_workers: int = DOWNLOAD_WORKERS,
+    ) -> str:
         """
         Get a formatted string of the contents of the repository (or subfolder).
 
@@ -244,6 +666,8 @@ class GithubRepository:
             Git branch to target. If None, defaults to self.branch.
         recursively : bool, optional
             Whether to get the content recursively (default: True).
+        max_workers : int, optional
+            Number of folders listed in parallel (default: DOWNLOAD_WORKERS).
 
         Raises
         ------
@@ -269,31 +693,64 @@ class GithubRepository:
         n_tab = 4
         tab = f"{'':{n_tab}}"
         size_tab = f"{'':{n_tab + 3}}"
-        # Get contents json from github api
-        contents = self.contents(subfolder=subfolder, branch=branch)
-
-        # Get content
-        lines = [f"{size_tab}{tab * _level}/{subfolder}"] if subfolder else []
-        for item in contents:
+        # Get contents json of all folders from github api
+        folders = self._list_folders(subfolder, branch, recursively, max_workers)
+
+        # Get content (folders are written before the remaining items of their parent)
+        lines = [f"{size_tab}/{subfolder}"] if subfolder else []
+        stack = [(subfolder, 0, iter(folders[subfolder]))]
+        while stack:
+            folder, level, items = stack[-1]
+            if (item := next(items, None)) is None:
+                stack.pop()
+                continue
             name = item["name"]
-            size = item["size"]
             if item["type"] == "file":
-                lines.append(
-                    f"{format_size(size, n_max=n_tab)}{tab * (_level + 1)}{name}"
-                )
+                size_str = format_size(item["size"], n_max=n_tab)
+                lines.append(f"{size_str}{tab * (level + 1)}{name}")
             elif item["type"] == "dir" and recursively:
-                new_subfolder = f"{subfolder}/{name}" if subfolder else name
-                lines.append(
-                    self.get_contents_str(
-                        subfolder=new_subfolder,
-                        branch=branch,
-                        recursively=recursively,
-                        _level=_level + 1,
-                    )
-                )
+                new_subfolder = f"{folder}/{name}" if folder else name
+                lines.append(f"{size_tab}{tab * (level + 1)}/{new_subfolder}")
+                stack.append((new_subfolder, level + 1, iter(folders[new_subfolder])))
 
         return "\n".join(lines)
 
+    def _list_folders(
+        self,
+        subfolder: str | None = None,
+        branch: str | None = None,
+        recursively: bool = True,
+        max_workers: int = DOWNLOAD_WORKERS,
+    ) -> dict[str | None, list[dict]]:
+        """List a folder and (if wanted) all its subfolders in parallel threads."""
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        folders = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Pending folder listings and their subfolder
+            listings = {}
+
+            def list_folder(folder: str | None) -> None:
+                listing = executor.submit(
+                    self.contents, subfolder=folder, branch=branch
+                )
+                listings[listing] = folder
+
+            list_folder(subfolder)
+            while listings:
+                done, _ = wait(listings, return_when=FIRST_COMPLETED)
+                for listing in done:
+                    folder = listings.pop(listing)
+                    folders[folder] = contents = listing.result()
+                    if not recursively:
+                        continue
+                    for item in contents:
+                        if item["type"] == "dir":
+                            name = item["name"]
+                            list_folder(f"{folder}/{name}" if folder else name)
+
+        return folders
+
     def _finalize_url(
         self, url: str, add: str | None = None, branch: str | None = None
     ) -> str:
@@ -318,7 +775,7 @@ class GithubRepository:
         if add is not None:
             url = f"{url}/{add}"
         if branch is None:
-            branch = self.branch
+            return f"{url}{self._branch_suffix}"
         if branch:
             url = f"{url}?ref={branch}"
 
@@ -329,3 +786,7 @@ class GithubRepository:
         self._url_owner = f"{self._base_url}/{self.owner}"
         self._url = f"{self._url_owner}/{self.name}"
         self._api_url = f"{self._base_api_url}/{self.owner}/{self.name}"
+        self._api_urls = {
+            name: f"{self._api_url}{suffix}"
+            for name, suffix in _API_URL_SUFFIXES.items()
+        }
@@ -8,11 +8,16 @@ Includes tools to:
 - Create and manage a Git repository.
 """
 
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from pkgcreator.logging_tools import logged_subprocess_run
 
+# Resolve the executable once instead of searching 'PATH' for every Git call
+GIT_EXECUTABLE = shutil.which("git") or "git"
+
 
 class GitNotAvailableError(OSError):
     """Exception class when no Git installation was not found."""
@@ -62,10 +67,11 @@ def run_git_command(
         kwargs["stdout"] = subprocess.DEVNULL
         kwargs["stderr"] = subprocess.DEVNULL
 
+    command = [GIT_EXECUTABLE, *args]
     if logger and not silent:
-        return logged_subprocess_run(["git", *args], logger=logger, **kwargs)
+        return logged_subprocess_run(command, logger=logger, **kwargs)
     else:
-        return subprocess.run(["git", *args], **kwargs)
+        return subprocess.run(command, **kwargs)
 
 
 def get_git_config_value(key: str) -> str | None:
@@ -94,6 +100,37 @@ def get_git_config_value(key: str) -> str | None:
         return None
 
 
+@lru_cache(maxsize=1)
+def get_git_user_config() -> dict[str, str]:
+    """
+    Get all 'user.*' values of the Git config with a single Git call.
+
+    The result is cached, i.e. Git is only called once per session.
+
+    Returns
+    -------
+    dict of str
+        Mapping of config keys (e.g. 'user.name') to their values.
+    """
+    try:
+        result = run_git_command(
+            *["config", "--get-regexp", r"^user\."],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    config = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if value := value.strip():
+            config[key] = value
+
+    return config
+
+
 def _is_git_available() -> bool:
     """
     Check if Git is available on the system.
@@ -144,7 +181,9 @@ class GitRepository:
 
     def run_command(self, *args, **kwargs) -> subprocess.CompletedProcess:
         """Run a Git command in the context of the repository."""
-        return run_git_command(*args, cwd=self.path, logger=self.logger, **kwargs)
+        return run_git_command(
+            "-C", str(self.path), *args, logger=self.logger, **kwargs
+        )
 
     def exists(self) -> bool:
         """
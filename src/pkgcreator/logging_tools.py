@@ -201,6 +201,8 @@ COLORS = {
     logging.CRITICAL: "\033[41m",  # red background
     "SUCCESS": "\033[92m",  # green
 }
+# Everything in front of the message of an INFO record (the most common case)
+_INFO_PREFIX = f"{COLORS[logging.INFO]}{COLORS['SUCCESS']}[INFO]{RESET} "
 
 
 class LoggerFormatter(logging.Formatter):
@@ -236,17 +238,18 @@ class LoggerFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the specified record as text."""
-        color = COLORS.get(record.levelno, RESET)
+        levelno = record.levelno
+        if levelno == logging.INFO:
+            return f"{_INFO_PREFIX}{record.getMessage()}{RESET}"
+
+        color = COLORS.get(levelno, RESET)
         message = record.getMessage()
 
-        if record.levelno == logging.INFO:
-            title = f'{COLORS.get("SUCCESS", RESET)}[INFO]{RESET} '
-            description = ""
-        elif record.levelno == logging.WARNING:
+        if levelno == logging.WARNING:
             title = "[WARNING]"
             title = self.add_info_to_title(title, record)
             description = self.add_to_description("", record)
-        elif record.levelno >= logging.ERROR:
+        elif levelno >= logging.ERROR:
             exc_type = record.exc_info[0].__name__ if record.exc_info else "Error"
             title = f"[ERROR] {exc_type}:"
             title = self.add_info_to_title(title, record)
@@ -7,6 +7,7 @@ Includes tools to:
 - Install Python packages into a virtual environment.
 """
 
+import os
 import subprocess
 import venv
 from pathlib import Path
@@ -14,6 +15,12 @@ from sys import version_info
 
 from pkgcreator.logging_tools import logger, logged_subprocess_run
 
+# Locations of the Python executable in a venv, the most likely one first
+if os.name == "nt":
+    PYTHON_PATHS = (("Scripts", "python.exe"), ("bin", "python.exe"), ("bin", "python"))
+else:
+    PYTHON_PATHS = (("bin", "python"), ("bin", "python.exe"), ("Scripts", "python.exe"))
+
 
 class VirtualEnvironmentNotFoundError(FileNotFoundError):
     """Exception raised when virtual environment was not found."""
@@ -25,7 +32,10 @@ class InconsistentStateError(Exception):
 
 class ConcreteEnvBuilder(venv.EnvBuilder):
     """
-    Custom EnvBuilder that enforces pip and calls a post-creation callback.
+    Custom EnvBuilder that installs pip and calls a post-creation callback.
+
+    By default, pip is installed and the Python executable is symlinked instead of
+    copied on POSIX systems (like `python -m venv`).
 
     Parameters
     ----------
@@ -34,7 +44,8 @@ class ConcreteEnvBuilder(venv.EnvBuilder):
     """
 
     def __init__(self, *args, creation_callback: callable = None, **kwargs) -> None:
-        kwargs["with_pip"] = True
+        kwargs.setdefault("with_pip", True)
+        kwargs.setdefault("symlinks", os.name != "nt")
         self.creation_callback = creation_callback
         super().__init__(*args, **kwargs)
 
@@ -85,7 +96,10 @@ class VirtualEnvironment:
         self._parent_dir = Path(parent_dir)
         self._venv_dir = self._parent_dir / dir_name
         self._created_venv_exe = None
+        # Executable of an existing venv, looked up on first access (see `python`)
         self._venv_exe = None
+        # Whether pip must be installed before installing packages (see `create()`)
+        self._needs_pip = False
 
     @property
     def venv_dir(self) -> Path:
@@ -126,24 +140,35 @@ class VirtualEnvironment:
             )
             raise VirtualEnvironmentNotFoundError(msg)
 
-        possible_paths = (
-            self.venv_dir / "bin" / "python.exe",
-            self.venv_dir / "Scripts" / "python.exe",
-            self.venv_dir / "bin" / "python",
-        )
-
-        for path in possible_paths:
-            if path.exists():
-                self._venv_exe = path
-                return path
-        else:
+        if (path := self._find_python()) is None:
             msg = f"No python executable found in '{self.venv_dir}'!"
             raise VirtualEnvironmentNotFoundError(msg)
+        self._venv_exe = path
+
+        return path
+
+    def _find_python(self) -> Path | None:
+        """Return the Python executable in the venv directory (None if not found)."""
+        for subdir, name in PYTHON_PATHS:
+            if (path := self.venv_dir / subdir / name).exists():
+                return path
 
-    def create(self) -> None:
+        return None
+
+    def create(self, with_pip: bool = True, symlinks: bool = os.name != "nt") -> None:
         """
         Create the virtual environment.
 
+        Parameters
+        ----------
+        with_pip : bool, optional
+            Whether to install pip into the venv right away (default: True). Without
+            pip, the creation is much faster and pip is installed by
+            `install_packages()` only when it is needed.
+        symlinks : bool, optional
+            Whether to symlink the Python executable instead of copying it (default:
+            True, except on Windows).
+
         Raises
         ------
         FileExistsError
@@ -156,10 +181,56 @@ class VirtualEnvironment:
             raise FileExistsError(msg)
 
         logger.info(f"Creating venv in '{self.venv_dir}' (this may take some time)...")
-        builder = ConcreteEnvBuilder(creation_callback=self._process_creation_context)
+        # Forget a previous lookup, the new venv sets the executable on creation
+        self._venv_exe = None
+        builder = ConcreteEnvBuilder(
+            with_pip=with_pip,
+            symlinks=symlinks,
+            creation_callback=self._process_creation_context,
+        )
         builder.create(self.venv_dir)
+        self._needs_pip = not with_pip
         logger.info(f"Finished creating venv in '{self.venv_dir}'.")
 
+    @staticmethod
+    def create_many(
+        envs: list["VirtualEnvironment"],
+        with_pip: bool = True,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Create several virtual environments in parallel processes.
+
+        Parameters
+        ----------
+        envs : list of VirtualEnvironment
+            Virtual environments to create.
+        with_pip : bool, optional
+            Whether to install pip into the venvs right away (default: True).
+        max_workers : int, optional
+            Number of processes (default: number of CPUs).
+
+        Raises
+        ------
+        FileExistsError
+            If the venv directory already exists (the first error is raised after
+            all other venvs were created).
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = [executor.submit(_create_venv, env, with_pip) for env in envs]
+
+        errors = []
+        for env, result in zip(envs, results, strict=True):
+            if (err := result.exception()) is not None:
+                errors.append(err)
+            else:
+                # The venv was created by a copy of the object in another process
+                env._needs_pip = not with_pip
+        if errors:
+            raise errors[0]
+
     def exists(self, ensure_logic: bool = True) -> bool:
         """
         Check whether the virtual environment already exists.
@@ -231,7 +302,32 @@ class VirtualEnvironment:
         kwargs.setdefault("stdout", subprocess.PIPE)
         kwargs.setdefault("stderr", subprocess.PIPE)
 
+        # Skip pip's online check for a newer version of itself
+        kwargs.setdefault("env", {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"})
+
         python = str(self.python)
+        if self._needs_pip:
+            # The venv was created without pip, install it now
+            logged_subprocess_run(
+                [python, "-m", "ensurepip", "--default-pip"], logger=logger, **kwargs
+            )
+            self._needs_pip = False
+
+        # Install everything with one pip call, so that pip resolves only once (if
+        # this fails, install the packages one by one to get the working ones)
+        if len(packages) + len(editable_packages) > 1:
+            try:
+                pip_install(
+                    python,
+                    packages,
+                    "--no-input",
+                    editable_packages=editable_packages,
+                    logger=logger,
+                    **kwargs,
+                )
+                return
+            except Exception as err:
+                logger.warning(f"Could not install all packages at once: {err}")
 
         for package in packages:
             try:
@@ -259,14 +355,27 @@ class VirtualEnvironment:
         self._created_venv_exe = context.env_exe
 
 
+def _create_venv(env: VirtualEnvironment, with_pip: bool) -> None:
+    """Create a virtual environment (used by the processes of `create_many()`)."""
+    env.create(with_pip=with_pip)
+
+
 def pip_install(
-    python: str, package: str, *pip_args, silent: bool = False, logger=None, **kwargs
+    python: str,
+    package: str | list[str],
+    *pip_args,
+    editable_packages: list[str] | None = None,
+    silent: bool = False,
+    logger=None,
+    **kwargs,
 ) -> subprocess.CompletedProcess:
     """
-    Install a Python package using `pip` via a given Python interpreter.
+    Install Python packages using `pip` via a given Python interpreter.
 
     This function constructs and runs a pip install command like:
-    `[python, -m, pip, install, *pip_args, package]`.
+    `[python, -m, pip, install, *pip_args, *packages, -e, editable_package, ...]`.
+    Installing several packages at once is faster, since pip resolves the
+    dependencies only once.
 
     If a logger is provided and `silent` is False, output is streamed
     in real time using `logged_subprocess_run`. Otherwise, `subprocess.run`
@@ -276,10 +385,12 @@ def pip_install(
     ----------
     python : str
         Path to the Python interpreter to use for the pip command.
-    package : str
-        The name of the package to install.
+    package : str or list of str
+        The name of the package to install (or a list of names).
     *pip_args : str
         Additional arguments passed to `pip install` (e.g., `--upgrade`).
+    editable_packages : list of str, optional
+        Local package paths to install in editable mode within the same call.
     silent : bool, optional
         If True, disables logging even if a logger is provided. Default is False.
     logger : logging.Logger, optional
@@ -295,7 +406,10 @@ def pip_install(
         The result of the subprocess call, containing the exit code and (if captured)
         output.
     """
-    command = [python, "-m", "pip", "install", *pip_args, package]
+    packages = [package] if isinstance(package, str) else package
+    command = [python, "-m", "pip", "install", *pip_args, *packages]
+    for editable_package in editable_packages or ():
+        command += ("-e", editable_package)
     if logger and not silent:
         return logged_subprocess_run(command, logger=logger, **kwargs)
     else:
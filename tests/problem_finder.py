@@ -1,10 +1,22 @@
 """Tools to find issues that might break the support for lower Python versions."""
 
 import ast
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from fnmatch import fnmatch
+from functools import cached_property, partial
+from itertools import accumulate
 from pathlib import Path
 
+# Pattern found in every file with an issue: the start of an f-string (with any
+# combination of prefixes, e.g. rf"" or Fr'') or a default None (with any spacing),
+# files without a match do not need to be parsed
+ISSUE_PATTERN = re.compile(rb"[fF][rRbB]?['\"]|=\s*None")
+
 
 @dataclass
 class Issue:
@@ -53,6 +65,39 @@ class Issue:
         return f"[PEP {self.issuetype}] {self.filepath}:{self.lineno}: {self.msg}"
 
 
+class FunctionDefVisitor(ast.NodeVisitor):
+    """
+    Call a function for each (async) function definition in an ast tree.
+
+    Only statements are traversed, since function definitions cannot be part of
+    expressions. This skips most of the nodes of a tree.
+
+    Parameters
+    ----------
+    callback : callable
+        Function that is called with each function definition node.
+    """
+
+    # Nodes that contain statements (apart from the statements themselves)
+    _STATEMENT_CONTAINERS = (ast.stmt, ast.ExceptHandler, ast.match_case)
+
+    def __init__(self, callback: callable) -> None:
+        self.callback = callback
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Call the callback and visit the (nested) statements of the function."""
+        self.callback(node)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit only the children of the node that are (or contain) statements."""
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, self._STATEMENT_CONTAINERS):
+                self.visit(child)
+
+
 class FileChecker:
     """
     Provide checks for a file.
@@ -60,24 +105,46 @@ class FileChecker:
     Raises an error on initialisation if the file could not be read or parsed to ast.
     """
 
-    def __init__(self, filepath: str | Path) -> None:
-        self._load_from(filepath)
+    def __init__(self, filepath: str | Path, data: bytes | None = None) -> None:
+        self._load_from(filepath, data)
+
+    def _load_from(self, filepath: str | Path, data: bytes | None = None) -> None:
+        """
+        Load source and ast tree from filepath and set attributes of the object.
 
-    def _load_from(self, filepath: str | Path) -> None:
-        """Load source and ast tree from filepath and set attributes of the object."""
+        The already read content of the file can be passed to avoid reading it again.
+        The source is kept as bytes (`ast.parse` decodes it itself), it is only
+        decoded when needed.
+        """
         self._filepath = Path(filepath)
-        self._source = filepath.read_text(encoding="utf-8")
-        self._tree = ast.parse(self.source, filename=str(filepath))
+        if data is None:
+            data = self._filepath.read_bytes()
+        self._source_bytes = data
+        self._tree = ast.parse(data, filename=str(filepath))
+
+    @cached_property
+    def _line_offsets(self) -> list[int]:
+        """Return the offsets of the line starts in the source bytes."""
+        line_lengths = (len(line) + 1 for line in self._source_bytes.split(b"\n"))
+        return list(accumulate(line_lengths, initial=0))
+
+    def _segment(self, node: ast.AST) -> str:
+        """Return the source code of a node (like `ast.get_source_segment`)."""
+        # The column offsets of the ast nodes count UTF-8 bytes, so the segments are
+        # sliced from the source bytes with the offsets of the line starts
+        start = self._line_offsets[node.lineno - 1] + node.col_offset
+        end = self._line_offsets[node.end_lineno - 1] + node.end_col_offset
+        return self._source_bytes[start:end].decode("utf-8")
 
     @property
     def filepath(self) -> Path:
         """Return the path to the inspected file."""
         return self._filepath
 
-    @property
+    @cached_property
     def source(self) -> str:
         """Return the source content of the inspected file."""
-        return self._source
+        return self._source_bytes.decode("utf-8")
 
     @property
     def tree(self) -> ast.Module:
@@ -99,26 +166,27 @@ class FileChecker:
         issues = []
         for node in ast.walk(self.tree):
             if isinstance(node, ast.JoinedStr):
-                for part in node.values:
-                    if isinstance(part, ast.FormattedValue):
-                        expr_text = ast.get_source_segment(self.source, part)
-                        if expr_text and ('"' in expr_text or "'" in expr_text):
-                            full_fstring = ast.get_source_segment(self.source, node)
-                            issues.append(
-                                Issue(
-                                    issuetype=701,
-                                    filepath=self.filepath,
-                                    lineno=node.lineno,
-                                    msg=(
-                                        "Works for Python < 3.12?: "
-                                        f"{full_fstring.strip()}"
-                                    ),
-                                )
-                            )
-                            # Count only one time
-                            break
+                self._visit_nested_fstring(node, issues)
         return issues
 
+    def _visit_nested_fstring(self, node: ast.JoinedStr, issues: list[Issue]) -> None:
+        """Add an issue if the f-string contains a nested string."""
+        for part in node.values:
+            if isinstance(part, ast.FormattedValue):
+                expr_text = self._segment(part)
+                if expr_text and ('"' in expr_text or "'" in expr_text):
+                    full_fstring = self._segment(node)
+                    issues.append(
+                        Issue(
+                            issuetype=701,
+                            filepath=self.filepath,
+                            lineno=node.lineno,
+                            msg=f"Works for Python < 3.12?: {full_fstring.strip()}",
+                        )
+                    )
+                    # Count only one time
+                    break
+
     def check_kwarg_none_typing(self) -> list[Issue]:
         """
         Check parameters with default None but missing Optional[Type] or `| None`.
@@ -131,28 +199,49 @@ class FileChecker:
         list of Issue
             List of issues.
         """
-        issues = []
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                defaults = node.args.defaults
-                args = node.args.args[-len(defaults) :] if defaults else []
-                for arg, default in zip(args, defaults, strict=True):
-                    if isinstance(default, ast.Constant) and default.value is None:
-                        if arg.annotation:
-                            ann_str = ast.unparse(arg.annotation)
-                            if "None" not in ann_str and "Optional" not in ann_str:
-                                issues.append(
-                                    Issue(
-                                        issuetype=484,
-                                        filepath=self.filepath,
-                                        lineno=node.lineno,
-                                        msg=(
-                                            f"Param '{arg.arg}' default None, but hint "
-                                            f"is '{ann_str}'"
-                                        ),
-                                    )
-                                )
-        return issues
+        return self.check(["check_kwarg_none_typing"])
+
+    def _visit_kwarg_none_typing(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, issues: list[Issue]
+    ) -> None:
+        """Add an issue for each parameter with default None but no None hint."""
+        defaults = node.args.defaults
+        # The defaults belong to the last positional parameters (positional-only too)
+        positional_args = node.args.posonlyargs + node.args.args
+        args = positional_args[-len(defaults) :] if defaults else []
+        for arg, default in zip(args, defaults, strict=True):
+            if isinstance(default, ast.Constant) and default.value is None:
+                if arg.annotation:
+                    ann_str = ast.unparse(arg.annotation)
+                    if "None" not in ann_str and "Optional" not in ann_str:
+                        issues.append(
+                            Issue(
+                                issuetype=484,
+                                filepath=self.filepath,
+                                lineno=node.lineno,
+                                msg=(
+                                    f"Param '{arg.arg}' default None, but hint "
+                                    f"is '{ann_str}'"
+                                ),
+                            )
+                        )
+
+    # Node types and visitor of each check (used by the single walk of `check()`)
+    _VISITORS = {
+        "check_nested_fstrings": ((ast.JoinedStr,), _visit_nested_fstring),
+        "check_kwarg_none_typing": (
+            (ast.FunctionDef, ast.AsyncFunctionDef),
+            _visit_kwarg_none_typing,
+        ),
+    }
+    # Visitors of all checks by node type (the default of `check()`)
+    _ALL_VISITORS = {
+        node_type: visitor
+        for node_types, visitor in _VISITORS.values()
+        for node_type in node_types
+    }
+    # Node types that `FunctionDefVisitor` finds without walking the expressions
+    _FUNCTION_DEF_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
 
     def check(self, checks: list[str] | None = None) -> list[Issue]:
         """
@@ -168,33 +257,98 @@ class FileChecker:
         list of Issue
             List of (possible) issues.
         """
-        checks = ["check_nested_fstrings", "check_kwarg_none_typing"]
+        if checks is None:
+            visitors = self._ALL_VISITORS
+        else:
+            # Collect the visitor of each check by the node type it inspects, so that
+            # the tree is walked only once for all checks
+            visitors = {}
+            for name in checks:
+                try:
+                    node_types, visitor = self._VISITORS[name]
+                except KeyError as _err:
+                    print(f"Could not find check function '{name}'!")
+                    continue
+                visitors.update(dict.fromkeys(node_types, visitor))
 
         all_issues = []
-        for name in checks:
-            try:
-                check_func = getattr(self, name)
-            except AttributeError as _err:
-                print(f"Could not find check function '{name}'!")
-                continue
-            all_issues.extend(check_func())
+        if not visitors:
+            return all_issues
+        if visitors.keys() <= self._FUNCTION_DEF_TYPES:
+            # Only function definitions are inspected, the statements are enough
+            FunctionDefVisitor(
+                lambda node: visitors[type(node)](self, node, all_issues)
+            ).visit(self.tree)
+        else:
+            for node in ast.walk(self.tree):
+                if (visitor := visitors.get(type(node))) is not None:
+                    visitor(self, node, all_issues)
 
         return all_issues
 
 
+def may_have_issues(data: bytes) -> bool:
+    """Return whether the content of a file matches the `ISSUE_PATTERN`."""
+    return ISSUE_PATTERN.search(data) is not None
+
+
+def find_files(directory: str | Path, pattern: str = "*.py") -> Iterator[Path]:
+    """
+    Yield the files matching the pattern in a directory and all its subdirectories.
+
+    Like `Path.rglob()` (in the same order), but uses the file types returned by
+    `os.scandir()` instead of one `stat()` call per entry and reads every directory
+    only once. Symbolic links to directories are not followed.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif fnmatch(entry.name, pattern):
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from find_files(subdir, pattern)
+
+
+def check_file(filepath: Path, checks: list[str] | None = None) -> list[Issue]:
+    """Check a file for known issues (used by the processes of `ProblemFinder`)."""
+    data = filepath.read_bytes()
+    if not may_have_issues(data):
+        return []
+    return FileChecker(filepath, data).check(checks)
+
+
 class ProblemFinder:
-    """Find possible problems in all Python files in a directory."""
+    """
+    Find possible problems in all Python files in a directory.
+
+    The files are checked in parallel processes, since parsing is CPU-bound. The
+    names of the checks (default: all) are passed on to `FileChecker.check()`.
+    """
 
-    def __init__(self, path: str | Path, pattern: str = "*.py") -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        pattern: str = "*.py",
+        max_workers: int | None = None,
+        checks: list[str] | None = None,
+    ) -> None:
         self._path = Path(path)
         self._pattern = pattern
+        self._max_workers = max_workers
+        self._checks = checks
 
     def check(self) -> list[Issue]:
         """Check all files in the directory recursively."""
+        # The files are passed on while the directories are still walked, so that the
+        # first checks start without waiting for the complete list
+        files = find_files(self._path, self._pattern)
+        check = partial(check_file, checks=self._checks)
         all_issues = []
-        for file in self._path.rglob(self._pattern):
-            checker = FileChecker(file)
-            all_issues.extend(checker.check())
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            for issues in executor.map(check, files, chunksize=16):
+                all_issues.extend(issues)
 
         return all_issues
 
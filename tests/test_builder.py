@@ -0,0 +1,145 @@
+"""Tests for the package structure builder."""
+
+import argparse
+from pathlib import Path
+
+import pytest
+
+from pkgcreator import PackageExistsError, ProjectSettings, PythonPackage
+from pkgcreator.builder import (
+    PARALLEL_WRITE_THRESHOLD,
+    create_dir_structure,
+    walk_structure,
+)
+
+
+def test_package_structure_with_content(tmp_path: Path) -> None:
+    """Test the created files and directories and their content."""
+    builder = PythonPackage(tmp_path, "test_package", add_main=True)
+    builder.create(
+        file_content={"README.md": "# test_package\n", ".gitignore": b".venv\n"}
+    )
+
+    project_path = tmp_path / "test_package"
+    assert builder.project_path == project_path
+    assert (project_path / "README.md").read_text() == "# test_package\n"
+    assert (project_path / "LICENSE").read_text() == ""
+    assert (project_path / ".gitignore").read_bytes() == b".venv\n"
+    assert (project_path / "src" / "test_package" / "__init__.py").is_file()
+    assert (project_path / "src" / "test_package" / "__main__.py").is_file()
+    assert builder.get_all_filenames() == [
+        "__init__.py",
+        "__main__.py",
+        "LICENSE",
+        "README.md",
+        "pyproject.toml",
+        ".gitignore",
+    ]
+
+    # The structure is only recreated when it changes
+    assert builder.structure is builder.structure
+    builder.add_main = False
+    assert "__main__.py" not in builder.get_all_filenames()
+
+    # Creating again should not be possible
+    with pytest.raises(PackageExistsError):
+        builder.create()
+
+
+def test_walk_structure_order() -> None:
+    """Test that the structure is walked depth-first in order of definition."""
+    structure = {"a": {"b": {"FILES": ["x"]}, "FILES": ["y"]}, "FILES": ["z"], "c": {}}
+    assert [Path(path) for _, path, _ in walk_structure(structure, "root")] == [
+        Path("root/a"),
+        Path("root/a/b"),
+        Path("root/a/b/x"),
+        Path("root/a/y"),
+        Path("root/z"),
+        Path("root/c"),
+    ]
+
+
+def test_dir_structure_many_files(tmp_path: Path) -> None:
+    """Test the creation of a structure with many files (written in parallel)."""
+    filenames = [f"file_{idx}.txt" for idx in range(2 * PARALLEL_WRITE_THRESHOLD)]
+    structure = {"many": {"sub": {"FILES": filenames}, "FILES": ["top.txt"]}}
+    create_dir_structure(
+        tmp_path, structure, file_content={name: name for name in filenames}
+    )
+    for name in filenames:
+        assert (tmp_path / "many" / "sub" / name).read_text() == name
+    assert (tmp_path / "many" / "top.txt").read_bytes() == b""
+
+    with pytest.raises(FileExistsError):
+        create_dir_structure(tmp_path, {"FILES": ["many"]})
+
+
+def test_project_settings_urls() -> None:
+    """Test the URLs created from the GitHub settings (also after changing them)."""
+    settings = ProjectSettings(github_username="user", github_repositoryname="repo")
+    assert settings.github == "https://github.com/user/repo"
+    assert settings.issues == "https://github.com/user/repo/issues"
+    assert settings.homepage == settings.github
+    assert settings.funding is None
+    assert settings.urls["Issues"] == "https://github.com/user/repo/issues"
+    assert "repo" in settings.nice_str
+
+    settings.github_repositoryname = "other"
+    assert settings.github == "https://github.com/user/other"
+    assert settings.github_owner == "https://github.com/user"
+    assert settings.source == "https://github.com/user/other.git"
+    assert settings.urls["Issues"] == "https://github.com/user/other/issues"
+    assert "other" in settings.nice_str
+
+    settings.issues = "https://example.com/issues"
+    assert settings.issues == "https://example.com/issues"
+    assert not settings.is_default("issues")
+    assert settings.is_default("source")
+
+    settings.issues = None
+    assert settings.issues == "https://github.com/user/other/issues"
+    assert settings.is_default("issues")
+
+    # Lists changed in place are shown as well
+    settings.dependencies.append("some-dependency")
+    assert "some-dependency" in settings.nice_str
+
+
+def test_project_settings_defaults() -> None:
+    """Test the detection of default values."""
+    settings = ProjectSettings(name="changed")
+    assert not settings.is_default("name")
+    assert settings.is_default("author_name")
+    assert settings.is_default("classifiers")
+
+    # Fields with a default factory are compared to a new default value
+    assert settings.is_default("dependencies")
+    settings.dependencies = ["numpy"]
+    assert not settings.is_default("dependencies")
+
+    # URLs filled from the GitHub settings are default until set explicitly
+    assert settings.documentation is not None
+    assert settings.is_default("documentation")
+    settings.documentation = "https://example.com/docs"
+    assert not settings.is_default("documentation")
+    settings.documentation = None
+    assert settings.is_default("documentation")
+
+    with pytest.raises(AttributeError):
+        settings.is_default("unknown")
+
+
+def test_project_settings_argparser() -> None:
+    """Test the conversion of the command line arguments to project settings."""
+    parser = argparse.ArgumentParser()
+    ProjectSettings.add_to_argparser(parser, ignore=("name",))
+    args = parser.parse_args(
+        ["--make-script", "yes", "--author-name", "Someone", "--dependencies", "a", "b"]
+    )
+    settings = ProjectSettings.from_argparser(args)
+    assert settings.make_script is True
+    assert settings.author_name == "Someone"
+    assert settings.dependencies == ["a", "b"]
+
+    args = parser.parse_args(["--make-script", "false"])
+    assert ProjectSettings.from_argparser(args).make_script is False
@@ -1,5 +1,6 @@
 """Tests for the CLI creation mode called by 'pkgcreator create'."""
 
+import stat
 from dataclasses import dataclass
 from importlib.util import find_spec
 from pathlib import Path
@@ -30,6 +31,15 @@ def get_mock_args(tmp_path: Path, **kwargs) -> MockCLIArgs:
     return MockCLIArgs(destination=tmp_path, name="test_package", **kwargs)
 
 
+def is_non_empty_file(path: Path) -> bool:
+    """Return whether the path is a non-empty file (with a single stat call)."""
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError:
+        return False
+    return stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
+
+
 def test_creation_fails_if_path_exists(tmp_path: Path) -> None:
     """Test whether the creation raises an error if the project path already exists."""
     args = get_mock_args(tmp_path)
@@ -52,8 +62,7 @@ def test_basic_package_structure(tmp_path: Path) -> None:
 
     non_empty_files = [pkg_path / "pyproject.toml", pkg_path / "README.md"]
     for file in non_empty_files:
-        assert file.is_file()
-        assert file.stat().st_size > 0
+        assert is_non_empty_file(file)
 
     assert (pkg_path / "LICENSE").is_file()
 
@@ -76,5 +85,4 @@ def test_license_file_created(tmp_path: Path) -> None:
     creation_mode(args)
 
     license_file = tmp_path / args.name / "LICENSE"
-    assert license_file.exists()
-    assert license_file.stat().st_size > 0
+    assert is_non_empty_file(license_file)
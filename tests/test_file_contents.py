@@ -0,0 +1,134 @@
+"""Tests for the file content creation and the license tools."""
+
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from pkgcreator import FileContent, ProjectSettings, file_contents
+from pkgcreator.file_contents import (
+    get_all_licenses_bulk,
+    get_available_licenses,
+    get_licenses_cache_file,
+    invalidate_cache,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Use a temporary cache directory and start with empty caches."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    invalidate_cache()
+    yield tmp_path / "pkgcreator"
+    invalidate_cache()
+
+
+def test_licenses_from_cache(cache_dir: Path) -> None:
+    """Test whether the license listing is read from the cache file."""
+    licenses = {"mit": "https://example.com/mit.txt"}
+    cache_file = get_licenses_cache_file()
+    assert cache_file.parent == cache_dir
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(json.dumps(licenses), encoding="utf-8")
+
+    assert get_available_licenses() == licenses
+    # Second call is served from memory, even without the cache file
+    cache_file.unlink()
+    assert get_available_licenses() == licenses
+
+    invalidate_cache()
+    assert get_available_licenses.cache_info().currsize == 0
+
+
+def test_file_content_cached() -> None:
+    """Test whether contents are reused for identical project settings only."""
+    FileContent.clear_cache()
+    settings = ProjectSettings(name="cached_package")
+    content = FileContent(settings)
+    assert "cached_package" in content["pyproject.toml"]
+    assert FileContent(ProjectSettings(name="cached_package")) == content
+    encoded = content.encoded()
+    assert encoded["pyproject.toml"] == content["pyproject.toml"].encode("utf-8")
+    assert isinstance(content[".gitignore"], str)
+    assert encoded[".gitignore"] == content[".gitignore"].encode("utf-8")
+
+    settings.description = "Other description"
+    assert "Other description" in FileContent(settings)["pyproject.toml"]
+    FileContent.clear_cache()
+
+
+def test_file_content_cache_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether only the most recently used contents are kept."""
+    monkeypatch.setattr(file_contents, "CONTENT_CACHE_SIZE", 6)
+    FileContent.clear_cache()
+    first = ProjectSettings(name="first_package")
+    FileContent(first)
+    for index in range(3):
+        FileContent(ProjectSettings(name=f"package_{index}"))
+        # Using the first settings again keeps their contents
+        FileContent(first)
+    assert len(FileContent._cache) <= 6
+    assert any(first.cache_key in key for key in FileContent._cache)
+    FileContent.clear_cache()
+
+
+def test_file_content_mapping() -> None:
+    """Test whether FileContent still behaves like a dictionary of the files."""
+    content = FileContent(ProjectSettings(name="mapped_package"), **{"NEW.md": "new"})
+    assert not hasattr(content, "__dict__")
+    assert content.get("NEW.md") == "new"
+    assert content.get("missing") is None
+    assert {".gitignore", "LICENSE", "README.md", "__main__.py"} <= set(content)
+
+    content["OTHER.md"] = "other"
+    del content["NEW.md"]
+    assert "OTHER.md" in content and "NEW.md" not in content
+    assert dict(content) == dict(content.items())
+
+
+def test_licenses_bulk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the license texts extracted from a (streamed) repository tarball."""
+    files = {
+        "repo-abc/_licenses/mit.txt": "---\ntitle: MIT\n---\nMIT [fullname]\n",
+        "repo-abc/_licenses/notes.md": "no license",
+        "repo-abc/other/apache.txt": "no license",
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, text in files.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    class Response:
+        raw = io.BytesIO(buffer.getvalue())
+
+        def __enter__(self) -> "Response":
+            return self
+
+        def __exit__(self, *args) -> None:
+            pass
+
+        def raise_for_status(self) -> None:
+            pass
+
+    class Session:
+        def get(self, url: str, stream: bool, timeout: int) -> Response:
+            assert url == "tarball" and stream
+            return Response()
+
+    monkeypatch.setattr(file_contents, "get_session", Session)
+    get_all_licenses_bulk.cache_clear()
+    licenses = get_all_licenses_bulk("tarball")
+    get_all_licenses_bulk.cache_clear()
+    assert licenses == {"mit": "MIT [fullname]\n"}
+
+    # The texts are only used when passed on explicitly
+    settings = ProjectSettings(name="bulk_package", author_name="Author")
+    settings.license_id = "mit"
+    content = FileContent(settings, LICENSE=licenses["mit"])
+    assert content["LICENSE"] == "MIT [fullname]\n"
@@ -0,0 +1,41 @@
+"""Tests for the file content writing (Markdown, Toml)."""
+
+from pkgcreator.filetypes import Readme
+
+
+def test_content_after_editing_lines() -> None:
+    """Test whether the content follows edits of the lines with the same length."""
+    readme = Readme()
+    readme.add_text("first", "second")
+    assert readme.content == "first\nsecond"
+
+    readme.lines[1] = "changed"
+    assert readme.content == "first\nchanged"
+    readme.lines.pop()
+    readme.add_text("appended")
+    assert readme.content == "first\nappended"
+
+
+def test_toc_at_mark() -> None:
+    """Test whether the TOC is placed at its mark (or at the end without a mark)."""
+    readme = Readme()
+    readme.add_toc()
+    readme.add_heading("First heading")
+    readme.add_toc()
+    assert readme.lines[0] == "0. [First heading](#first-heading)"
+
+    # The mark was moved by an edit of the lines
+    readme = Readme()
+    readme.add_toc()
+    readme.lines.insert(0, "Intro")
+    readme.add_heading("Some_heading")
+    readme.add_toc()
+    assert readme.lines[1] == "0. [Some_heading](#some-heading)"
+
+    # The mark was removed
+    readme = Readme()
+    readme.add_toc()
+    readme.lines.clear()
+    readme.add_heading("Heading")
+    readme.add_toc()
+    assert readme.lines[-1] == "0. [Heading](#heading)\n"
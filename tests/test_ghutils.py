@@ -1,8 +1,12 @@
 """Tests for the GitHub tools."""
 
+import os
+import time
+from pathlib import Path
+
 import pytest
 
-from pkgcreator import GithubRepository
+from pkgcreator import GithubRepository, ghutils
 
 
 def test_github_urls() -> None:
@@ -46,6 +50,229 @@ def test_github_urls() -> None:
     )
 
 
+def test_github_download_traversal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test which folders are listed and files are downloaded (without network)."""
+    tree = {
+        None: [
+            {"name": "a.txt", "type": "file", "download_url": "url/a.txt"},
+            {"name": "sub", "type": "dir"},
+        ],
+        "sub": [
+            {"name": "b.txt", "type": "file", "download_url": "url/sub/b.txt"},
+            {"name": "deeper", "type": "dir"},
+        ],
+        "sub/deeper": [],
+    }
+    listed = []
+
+    def contents(subfolder=None, branch=None):
+        listed.append((subfolder, branch))
+        return tree[subfolder]
+
+    def download_file(download_url: str, file_path: Path, sha=None) -> None:
+        file_path.write_text(download_url)
+
+    repository = GithubRepository("owner", "repository")
+    monkeypatch.setattr(repository, "contents", contents)
+    monkeypatch.setattr(repository, "_download_file", download_file)
+    # Too large for the trees API, so the folders are listed one by one
+    monkeypatch.setattr(repository, "tree", lambda branch: {"truncated": True})
+    repository.download(tmp_path, branch="dev")
+
+    assert set(listed) == {(None, "dev"), ("sub", "dev"), ("sub/deeper", "dev")}
+    assert (tmp_path / "a.txt").read_text() == "url/a.txt"
+    assert (tmp_path / "sub" / "b.txt").read_text() == "url/sub/b.txt"
+    assert (tmp_path / "sub" / "deeper").is_dir()
+
+    listed.clear()
+    repository.download(tmp_path / "flat", recursively=False)
+    assert listed == [(None, None)]
+    assert not (tmp_path / "flat" / "sub").exists()
+
+    # With a token (e.g. for private repositories), the authenticated listings are used
+    listed.clear()
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    monkeypatch.setattr(repository, "tree", None)  # must not be used
+    repository.download(tmp_path / "private")
+    assert len(listed) == 3
+    assert (tmp_path / "private" / "sub" / "b.txt").read_text() == "url/sub/b.txt"
+
+
+def test_github_download_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the download of a complete repository listed by the trees API."""
+    tree = [
+        {"path": "a.txt", "type": "blob"},
+        {"path": "sub", "type": "tree"},
+        {"path": "sub/b c.txt", "type": "blob"},
+        {"path": "sub/deeper", "type": "tree"},
+        {"path": "module", "type": "commit"},
+        {"path": "link", "type": "blob", "mode": "120000"},
+    ]
+
+    def download_file(download_url: str, file_path: Path, sha=None) -> None:
+        file_path.write_text(download_url)
+
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    repository = GithubRepository("owner", "repository")
+    monkeypatch.setattr(repository, "contents", None)  # must not be used
+    monkeypatch.setattr(repository, "_download_file", download_file)
+    monkeypatch.setattr(
+        repository, "tree", lambda branch: {"tree": tree, "truncated": False}
+    )
+    repository.download(tmp_path, branch="dev")
+
+    raw_url = "https://raw.githubusercontent.com/owner/repository/dev"
+    assert (tmp_path / "a.txt").read_text() == f"{raw_url}/a.txt"
+    assert (tmp_path / "sub" / "b c.txt").read_text() == f"{raw_url}/sub/b%20c.txt"
+    assert (tmp_path / "sub" / "deeper").is_dir()
+    assert not (tmp_path / "module").exists()
+    assert not (tmp_path / "link").exists()
+
+
+def test_github_api_etag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether API responses are revalidated with their cached ETag."""
+
+    class Response:
+        def __init__(self, status_code: int, text: str = "") -> None:
+            self.status_code = status_code
+            self.text = text
+            self.content = text.encode()
+            self.headers = {"ETag": '"abc"'} if status_code == 200 else {}
+
+        def raise_for_status(self) -> None:
+            assert self.status_code < 400
+
+    sent_headers = []
+
+    class Session:
+        def get(self, url: str, headers: dict, timeout: float) -> Response:
+            sent_headers.append(headers)
+            if headers.get("If-None-Match") == '"abc"':
+                return Response(304)
+            return Response(200, '[{"name": "a.txt"}]')
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.setattr(ghutils, "get_session", Session)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    url = "https://api.github.com/repos/owner/repository/contents"
+
+    assert ghutils.get_api_json(url) == [{"name": "a.txt"}]
+    assert ghutils.get_api_json(url) == [{"name": "a.txt"}]
+    assert [headers.get("If-None-Match") for headers in sent_headers] == [None, '"abc"']
+
+    # Authenticated responses are neither revalidated nor cached
+    cache_dir = tmp_path / "pkgcreator" / "api"
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    assert ghutils.get_api_json(f"{url}/sub") == [{"name": "a.txt"}]
+    assert "If-None-Match" not in sent_headers[-1]
+    assert len(list(cache_dir.iterdir())) == 1
+    monkeypatch.delenv("GITHUB_TOKEN")
+
+    # Expired responses are not used, and only the newest responses are kept
+    (cache_file,) = cache_dir.iterdir()
+    os.utime(cache_file, (0, 0))
+    assert ghutils.get_api_json(url) == [{"name": "a.txt"}]
+    assert "If-None-Match" not in sent_headers[-1]
+    os.utime(cache_file, (0, 0))
+    monkeypatch.setattr(ghutils, "API_CACHE_SIZE", 1)
+    assert ghutils.get_api_json(f"{url}/sub") == [{"name": "a.txt"}]
+    assert not cache_file.exists() and len(list(cache_dir.iterdir())) == 1
+
+
+def test_github_api_rate_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the token and the waiting for a reset of the rate limit."""
+
+    class Response:
+        def __init__(self, status_code: int, headers: dict) -> None:
+            self.status_code = status_code
+            self.headers = headers
+            self.text = "[]"
+            self.content = b"[]"
+
+        def raise_for_status(self) -> None:
+            assert self.status_code < 400
+
+    sent_headers = []
+
+    class Session:
+        def get(self, url: str, headers: dict, timeout: float) -> Response:
+            sent_headers.append(headers)
+            if len(sent_headers) == 1:
+                reset = str(int(time.time()) + 5)
+                limit = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+                return Response(403, limit)
+            return Response(200, {})
+
+    waited = []
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    monkeypatch.setattr(ghutils, "get_session", Session)
+    monkeypatch.setattr(ghutils.time, "sleep", waited.append)
+
+    assert ghutils.get_api_json("https://api.github.com/repos/owner/repo") == []
+    assert len(sent_headers) == 2 and len(waited) == 1
+    assert 0 < waited[0] <= 6
+    assert sent_headers[0]["Authorization"] == "Bearer secret"
+
+    # The token is only sent to the GitHub API
+    ghutils.get_api_json("https://example.com/api")
+    assert "Authorization" not in sent_headers[-1]
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+def test_github_download_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, encoding: str
+) -> None:
+    """Test whether a streamed file is written completely (without network)."""
+    content = b"line\n" * 50_000
+
+    class Response:
+        headers = {"Content-Length": "10", "Content-Encoding": encoding}
+        if encoding == "identity":
+            headers["Content-Length"] = str(len(content))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args) -> None:
+            pass
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int):
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+
+    class Session:
+        def get(self, url: str, stream: bool, timeout: float) -> Response:
+            return Response()
+
+    monkeypatch.setattr(ghutils, "get_session", Session)
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(b"old content that is longer " * 100_000)
+    GithubRepository._download_file("url", file_path)
+    assert file_path.read_bytes() == content
+
+
+def test_github_unchanged_file(tmp_path: Path) -> None:
+    """Test whether unchanged files are recognised by their git blob SHA-1."""
+    file_path = tmp_path / "hello.txt"
+    file_path.write_bytes(b"hello\n")
+    sha = "ce013625030ba8dba906f756967f9e9ca394464a"  # git hash-object hello.txt
+    assert ghutils.git_blob_sha(file_path) == sha
+    assert ghutils.get_file_sizes(tmp_path) == {"hello.txt": 6}
+    assert ghutils.get_file_sizes(tmp_path / "missing") == {}
+
+    # Nothing to download (the URL would fail)
+    GithubRepository._download_file("invalid-url", file_path, sha=sha)
+    assert file_path.read_bytes() == b"hello\n"
+
+
 @pytest.mark.skip(reason="github api limits access rate")
 def test_github_download() -> None:
     """Test the download function of GithubRepository."""
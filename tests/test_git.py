@@ -10,6 +10,8 @@ from pkgcreator import (
     GitRepository,
     GitRepositoryExistsError,
     GitRepositoryNotFoundError,
+    get_git_config_value,
+    get_git_user_config,
     run_git_command,
 )
 
@@ -60,3 +62,11 @@ def test_git_commit(tmp_path: Path) -> None:
     # Commit again -> Error: nothing to commit
     with pytest.raises(CalledProcessError):
         repo.commit("Test commit")
+
+
+@pytest.mark.skipif(not GIT_AVAILABLE, reason="Git not available")
+def test_git_user_config() -> None:
+    """Test whether the user config matches the single config values."""
+    user_config = get_git_user_config()
+    assert user_config.get("user.name") == get_git_config_value("user.name")
+    assert user_config.get("user.email") == get_git_config_value("user.email")
@@ -0,0 +1,69 @@
+"""Tests for the tools that find issues with lower Python versions."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from problem_finder import FileChecker, check_file, may_have_issues
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "x = f\"{y['a']}\"\n",
+        "x = fr\"{y['a']}\"\n",
+        "x = rf\"{y['a']}\"\n",
+        "x = Rf'{y[\"a\"]}'\n",
+        "x = fR\"{y['a']}\"\n",
+        "def h(x: int = None):\n    pass\n",
+        "def h(x: int=None):\n    pass\n",
+        "def h(x: int=  None):\n    pass\n",
+    ],
+)
+def test_prefilter_keeps_issues(tmp_path: Path, source: str) -> None:
+    """Test that files with an issue are not skipped by the prefilter."""
+    filepath = tmp_path / "example.py"
+    filepath.write_text(source, encoding="utf-8")
+    assert may_have_issues(source.encode("utf-8"))
+    assert len(check_file(filepath)) == 1
+
+
+def test_prefilter_skips_files(tmp_path: Path) -> None:
+    """Test that files without f-strings and default None are skipped."""
+    source = b'def h(x: int = 1) -> str:\n    return "None" + str(x)\n'
+    assert not may_have_issues(source)
+    filepath = tmp_path / "example.py"
+    filepath.write_bytes(source)
+    assert check_file(filepath) == []
+
+
+def test_kwarg_none_typing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the check of default None for async and positional-only parameters."""
+    filepath = tmp_path / "example.py"
+    filepath.write_text(
+        "def f(a: int = None, /, b: int = 1, c: str | None = None):\n"
+        "    pass\n"
+        "\n"
+        "\n"
+        "class C:\n"
+        "    if True:\n"
+        "        async def g(self, d: str = None):\n"
+        "            pass\n",
+        encoding="utf-8",
+    )
+    checker = FileChecker(filepath)
+    issues = checker.check_kwarg_none_typing()
+    assert sorted(issue.msg for issue in issues) == [
+        "Param 'a' default None, but hint is 'int'",
+        "Param 'd' default None, but hint is 'str'",
+    ]
+
+    # Only the statements are visited if no other check is enabled
+    def walk(node):
+        raise AssertionError("ast.walk must not be used")
+
+    monkeypatch.setattr(ast, "walk", walk)
+    assert sorted(map(str, checker.check(["check_kwarg_none_typing"]))) == sorted(
+        map(str, issues)
+    )
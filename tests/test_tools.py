@@ -5,9 +5,15 @@ import io
 import logging
 import re
 
-from pkgcreator.cli_tools import ConsistentFormatter
+from pkgcreator.cli_tools import (
+    ConsistentFormatter,
+    LazySubParsersAction,
+    get_prompt_bools,
+)
 from pkgcreator.logging_tools import LoggerFormatter
 
+ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
 
 def get_example_parsers() -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
     """Get an example pair of argparse (ArgumentParser, SubParser)."""
@@ -84,8 +90,7 @@ def test_argparse_formatter() -> None:
 
 def remove_ansi_codes(text: str) -> str:
     """Delete all ansi codes from a text."""
-    ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE.sub("", text)
 
 
 def test_logger_formatter() -> None:
@@ -125,3 +130,45 @@ def test_logger_formatter() -> None:
     assert "[INFO] some info" in clean_log
     assert "[WARNING] something went wrong" in clean_log
     assert "[ERROR] ValueError: something went wrong" in clean_log
+
+
+def test_prompt_bools(monkeypatch) -> None:
+    """Test the batched prompt for several decisions."""
+    messages = ["First?", "Second?", "Third?"]
+    assert get_prompt_bools(messages, "yes") == [True] * 3
+    assert get_prompt_bools(messages, "no", [True] * 3) == [False] * 3
+    assert get_prompt_bools(messages, "auto", [True, False, True]) == [
+        True,
+        False,
+        True,
+    ]
+
+    answers = iter(["Y", "n", "Y, n,Y", "Y,Y"])
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+    assert get_prompt_bools(messages, "ask") == [True] * 3
+    assert get_prompt_bools(messages, "ask") == [False] * 3
+    assert get_prompt_bools(messages, "ask") == [True, False, True]
+    assert get_prompt_bools(messages, "ask") == [True, True, False]
+
+
+def test_lazy_subparsers() -> None:
+    """Test that only the used subparsers are created."""
+    created = []
+
+    def get_parser(subparsers, feature_name: str) -> None:
+        created.append(feature_name)
+        subparser = subparsers.add_parser(feature_name, help=f"help of {feature_name}")
+        subparser.add_argument("--value", default=feature_name)
+
+    parser = argparse.ArgumentParser(prog="test")
+    subparsers = parser.add_subparsers(dest="feature", action=LazySubParsersAction)
+    for name in ("first", "second"):
+        subparsers.add_lazy_parser(name, get_parser, feature_name=name)
+
+    args = parser.parse_args(["second", "--value", "set"])
+    assert (args.feature, args.value) == ("second", "set")
+    assert created == ["second"]
+
+    help_str = parser.format_help()
+    assert "help of first" in help_str and "help of second" in help_str
+    assert created == ["second", "first"]
@@ -45,3 +45,28 @@ def test_venv_creation(tmp_path: Path) -> None:
         encoding="utf-8",
     )
     assert package_name in result.stdout
+
+
+def test_venv_python_lookup(tmp_path: Path) -> None:
+    """Test whether the Python executable of an existing venv is found."""
+    virtual_env = VirtualEnvironment(tmp_path)
+    assert not virtual_env.exists()
+
+    # The executable is looked up on access, not when the object is created
+    python = tmp_path / ".venv" / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.touch()
+    assert virtual_env.python == python
+    assert virtual_env.exists()
+
+
+def test_venv_create_many(tmp_path: Path) -> None:
+    """Test the parallel creation of virtual environments (without pip, it is fast)."""
+    envs = [VirtualEnvironment(tmp_path, venv_name=name) for name in (".a", ".b")]
+    VirtualEnvironment.create_many(envs, with_pip=False, max_workers=2)
+    for env in envs:
+        assert env.exists()
+        assert (env.venv_dir / ".gitignore").is_file()
+
+    with pytest.raises(FileExistsError):
+        VirtualEnvironment.create_many(envs[:1], with_pip=False, max_workers=1)